@@ -18,11 +18,14 @@ Features:
 
 import json
 import argparse
+import importlib.util
+import os
 import sys
 from pathlib import Path
+from collections import deque
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime
-from typing import Dict, List, Any, Optional
-from collections import defaultdict
+from typing import Deque, Dict, List, Any, Optional, Tuple
 
 try:
     import numpy as np
@@ -36,6 +39,99 @@ except ImportError:
     print("[ERROR] pandas is required. Install with: pip install pandas")
     sys.exit(1)
 
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional, falls back to the standard library json module
+
+# Optional, JIT-compiles group percentiles on very large result sets. Only
+# probed here: numba is imported (and the kernel compiled) on first use, so
+# ordinary runs skip its import and compile cost
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+# Placeholder for config keys absent from a result (distinct from an explicit None)
+_MISSING = object()
+
+
+def _group_percentiles(codes, values, n_groups, quantiles):
+    """
+    Linear-interpolated percentiles of values per group, skipping NaN.
+
+    Written for numba (see _jit_group_percentiles). Groups are small (a
+    handful of runs each), so a counting sort into contiguous segments plus
+    one small sort per segment beats the generic groupby quantile machinery.
+
+    Args:
+        codes: Group number of each value (0..n_groups-1)
+        values: Float values
+        n_groups: Number of groups
+        quantiles: Quantiles in [0, 1]
+
+    Returns:
+        Array of shape (n_groups, len(quantiles)), NaN for empty groups
+    """
+    counts = np.zeros(n_groups + 1, dtype=np.int64)
+    for i in range(values.shape[0]):
+        if not np.isnan(values[i]):
+            counts[codes[i] + 1] += 1
+    offsets = np.cumsum(counts)
+
+    fill = offsets[:-1].copy()
+    segments = np.empty(offsets[-1], dtype=np.float64)
+    for i in range(values.shape[0]):
+        if not np.isnan(values[i]):
+            segments[fill[codes[i]]] = values[i]
+            fill[codes[i]] += 1
+
+    out = np.full((n_groups, quantiles.shape[0]), np.nan)
+    for g in range(n_groups):
+        seg = np.sort(segments[offsets[g]:offsets[g + 1]])
+        n = seg.shape[0]
+        if n == 0:
+            continue
+        for j in range(quantiles.shape[0]):
+            pos = quantiles[j] * (n - 1)
+            lo = int(np.floor(pos))
+            hi = min(lo + 1, n - 1)
+            t = pos - lo
+            # Same lerp as np.percentile so results match the pandas path
+            diff = seg[hi] - seg[lo]
+            if t >= 0.5:
+                out[g, j] = seg[hi] - diff * (1 - t)
+            else:
+                out[g, j] = seg[lo] + diff * t
+    return out
+
+
+_compiled_group_percentiles = None
+
+
+def _jit_group_percentiles():
+    """Return _group_percentiles compiled with numba, compiling it on first use."""
+    global _compiled_group_percentiles
+    if _compiled_group_percentiles is None:
+        import numba
+        _compiled_group_percentiles = numba.njit(_group_percentiles)
+    return _compiled_group_percentiles
+
+
+class TestResult:
+    """Fields of one loaded result used by the aggregation."""
+
+    __slots__ = ('test_type', 'config_key', 'configuration', 'metrics')
+
+    def __init__(
+        self,
+        test_type: str,
+        config_key: Tuple[Any, ...],
+        configuration: Dict[str, Any],
+        metrics: Tuple[float, ...],
+    ):
+        self.test_type = test_type
+        self.config_key = config_key
+        self.configuration = configuration
+        self.metrics = metrics
+
 
 class ResultsAggregator:
     """
@@ -45,6 +141,49 @@ class ResultsAggregator:
     and generates summary reports.
     """
 
+    # Aggregated metrics: output name -> source key in the result 'metrics' dict
+    PRODUCER_METRICS = {
+        'throughput_mb': 'throughput_mb',
+        'throughput_rps': 'throughput_rps',
+        'avg_latency_ms': 'avg_latency_ms',
+        'p99_latency_ms': 'p99_ms',
+    }
+    CONSUMER_METRICS = {
+        'throughput_mb_sec': 'throughput_mb_sec',
+        'throughput_msg_sec': 'throughput_msg_sec',
+        'rebalance_time_ms': 'rebalance_time_ms',
+    }
+
+    # CSV export columns, in output order
+    PRODUCER_CSV_COLUMNS = (
+        'test_type', 'config_key', 'acks', 'batch_size', 'linger_ms',
+        'compression', 'record_size', 'test_count', 'throughput_mb_mean',
+        'throughput_mb_std', 'latency_ms_mean', 'latency_ms_std',
+    )
+    CONSUMER_CSV_COLUMNS = (
+        'test_type', 'config_key', 'fetch_min_bytes', 'max_poll_records',
+        'test_count', 'throughput_mb_mean', 'throughput_mb_std',
+    )
+
+    # Test type -> aggregated metrics; drives loading and aggregation for both types
+    _TYPE_METRICS = {'producer': PRODUCER_METRICS, 'consumer': CONSUMER_METRICS}
+
+    # Results buffered as records per test type before conversion to a DataFrame chunk
+    CHUNK_SIZE = 10000
+
+    # Percentiles switch to the numba kernel once this many results belong to
+    # configurations with repeated runs; below it importing numba and the
+    # one-off JIT compile (~2 s) cost more than pandas quantile spends
+    NUMBA_PERCENTILE_MIN_ROWS = 5000000
+
+    # Configuration keys that identify a distinct test configuration
+    _RELEVANT_KEYS = tuple(sorted([
+        'acks', 'batch_size', 'linger_ms', 'compression_type',
+        'compression', 'record_size', 'fetch_min_bytes',
+        'max_poll_records', 'num_producers', 'num_consumers'
+    ]))
+    _MISSING_DEFAULTS = (_MISSING,) * len(_RELEVANT_KEYS)
+
     def __init__(self, input_dir: str, verbose: bool = False):
         """
         Initialize the aggregator.
@@ -55,7 +194,15 @@ class ResultsAggregator:
         """
         self.input_dir = Path(input_dir)
         self.verbose = verbose
-        self.all_results: List[Dict[str, Any]] = []
+        self.result_count = 0
+        # Loaded results are kept as DataFrame chunks per test type rather
+        # than raw dicts; _pending buffers at most CHUNK_SIZE records per type
+        self._pending: Dict[str, List[TestResult]] = {t: [] for t in self._TYPE_METRICS}
+        self._metric_keys = {t: list(m.values()) for t, m in self._TYPE_METRICS.items()}
+        self._chunks: Dict[str, List[pd.DataFrame]] = {t: [] for t in self._TYPE_METRICS}
+        # First configuration seen for each config key, per test type
+        self._configurations: Dict[str, Dict[str, Dict[str, Any]]] = {t: {} for t in self._TYPE_METRICS}
+        self._summary_cache: Optional[Dict[str, Any]] = None
 
     def log(self, message: str) -> None:
         """Print message if verbose mode is enabled."""
@@ -69,7 +216,11 @@ class ResultsAggregator:
         Returns:
             Number of results loaded
         """
-        json_files = list(self.input_dir.glob('*.json'))
+        with os.scandir(self.input_dir) as entries:
+            json_files = sorted(
+                entry.path for entry in entries
+                if entry.name.endswith('.json') and entry.is_file()
+            )
 
         if not json_files:
             print(f"[WARN] No JSON files found in {self.input_dir}")
@@ -77,143 +228,306 @@ class ResultsAggregator:
 
         self.log(f"Found {len(json_files)} JSON files")
 
-        for json_file in sorted(json_files):
-            try:
-                with open(json_file, 'r', encoding='utf-8') as f:
-                    data = json.load(f)
-
-                # Handle both single result and list of results
-                if isinstance(data, list):
-                    self.all_results.extend(data)
-                    self.log(f"Loaded {len(data)} results from {json_file.name}")
-                else:
-                    self.all_results.append(data)
-                    self.log(f"Loaded 1 result from {json_file.name}")
+        # New results make any previously generated summary stale
+        self._summary_cache = None
+
+        # Reads and parses overlap in worker threads; results are consumed on
+        # this thread in file order (so no locking is needed). Only a few
+        # files per worker are in flight, and each file's data is dropped
+        # once it has been buffered, so memory stays bounded by the window
+        workers = min(32, len(json_files))
+        in_flight: Deque[Tuple[str, Future]] = deque()
+        with ThreadPoolExecutor(max_workers=workers) as executor:
+            for json_file in json_files:
+                in_flight.append((json_file, executor.submit(self._load_file, json_file)))
+                if len(in_flight) > 2 * workers:
+                    json_file, future = in_flight.popleft()
+                    self._add_file_results(json_file, future.result())
+            while in_flight:
+                json_file, future = in_flight.popleft()
+                self._add_file_results(json_file, future.result())
+
+        self._flush_pending()
+        for test_type, chunks in self._chunks.items():
+            if chunks:
+                frame = pd.concat(chunks, ignore_index=True) if len(chunks) > 1 else chunks[0]
+                # Few distinct configs: group on category codes instead of strings
+                frame['config_key'] = frame['config_key'].astype('category')
+                self._chunks[test_type] = [frame]
+
+        return self.result_count
+
+    def _add_file_results(self, json_file: str, data: Any) -> None:
+        """
+        Buffer the results loaded from one JSON file.
 
-            except Exception as e:
-                print(f"[ERROR] Failed to load {json_file}: {e}")
+        Args:
+            json_file: Path to the JSON file
+            data: Parsed file content, or the exception raised while loading it
+        """
+        try:
+            if isinstance(data, Exception):
+                raise data
+
+            # Handle both single result and list of results
+            if isinstance(data, list):
+                self.log(f"Loaded {len(data)} results from {os.path.basename(json_file)}")
+            else:
+                data = [data]
+                self.log(f"Loaded 1 result from {os.path.basename(json_file)}")
+            self.result_count += len(data)
+
+            # Partition by test type once so later passes skip the filtering
+            for result in data:
+                test_type = result.get('test_type')
+                pending = self._pending.get(test_type)
+                if pending is not None:
+                    pending.append(self._to_record(result, self._metric_keys[test_type]))
+                    if len(pending) >= self.CHUNK_SIZE:
+                        self._flush_pending()
+
+        except Exception as e:
+            print(f"[ERROR] Failed to load {json_file}: {e}")
+
+    def _flush_pending(self) -> None:
+        """Convert buffered result records into DataFrame chunks."""
+        for test_type, pending in self._pending.items():
+            if pending:
+                self._chunks[test_type].append(self._build_dataframe(pending, self._metric_keys[test_type]))
+                self._pending[test_type] = []
+
+    def _load_file(self, json_file: str) -> Any:
+        """
+        Read and parse a single JSON result file.
 
-        return len(self.all_results)
+        Args:
+            json_file: Path to the JSON file
 
-    def _config_to_key(self, config: Dict[str, Any]) -> str:
+        Returns:
+            Parsed JSON content, or the exception raised while loading it so
+            one bad file does not stop the remaining results
+        """
+        try:
+            with open(json_file, 'rb') as f:
+                raw = f.read()
+            return orjson.loads(raw) if orjson else json.loads(raw)
+        except Exception as e:
+            return e
+
+    def _config_to_key(self, config: Dict[str, Any]) -> Tuple[Any, ...]:
         """
-        Convert configuration dict to a hashable string key.
+        Convert configuration dict to a hashable tuple key.
 
         Args:
             config: Configuration dictionary
 
         Returns:
-            String key for grouping
+            Tuple of relevant config values (_MISSING where absent) for grouping
         """
-        # Select relevant keys for grouping
-        relevant_keys = [
-            'acks', 'batch_size', 'linger_ms', 'compression_type',
-            'compression', 'record_size', 'fetch_min_bytes',
-            'max_poll_records', 'num_producers', 'num_consumers'
-        ]
+        # map() over the presorted keys avoids a generator frame per result
+        return tuple(map(config.get, self._RELEVANT_KEYS, self._MISSING_DEFAULTS))
 
-        parts = []
-        for key in sorted(relevant_keys):
-            if key in config:
-                parts.append(f"{key}={config[key]}")
+    def _key_to_label(self, key: Tuple[Any, ...]) -> str:
+        """
+        Convert a tuple config key to its display string.
 
+        Args:
+            key: Tuple key from _config_to_key
+
+        Returns:
+            String key such as "acks=1|batch_size=16384", or "default"
+        """
+        parts = [
+            f"{name}={value}"
+            for name, value in zip(self._RELEVANT_KEYS, key)
+            if value is not _MISSING
+        ]
         return "|".join(parts) if parts else "default"
 
-    def aggregate_producer_results(self) -> Dict[str, Dict[str, Any]]:
+    def _to_record(self, result: Dict[str, Any], metric_keys: List[str]) -> TestResult:
         """
-        Aggregate producer results by configuration.
+        Extract the fields used by the aggregation from a result dict.
+
+        Args:
+            result: Parsed result dictionary
+            metric_keys: Metric keys to extract, in column order
 
         Returns:
-            Dictionary mapping config keys to aggregated statistics
+            TestResult with NaN for missing metrics
         """
-        producer_results = [
-            r for r in self.all_results
-            if r.get('test_type') == 'producer'
-        ]
+        config = result.get('configuration', {})
+        metrics = result.get('metrics', {})
+        return TestResult(
+            result.get('test_type'),
+            self._config_to_key(config),
+            config,
+            tuple(np.nan if (value := metrics.get(key)) is None else value for key in metric_keys),
+        )
+
+    def _build_dataframe(self, records: List[TestResult], metric_keys: List[str]) -> pd.DataFrame:
+        """
+        Flatten result records into a DataFrame for vectorized aggregation.
 
-        if not producer_results:
-            return {}
+        Missing and zero-valued metrics are stored as NaN so they are skipped
+        by the aggregation, except rebalance time where zero is a valid value.
 
-        # Group by configuration
-        groups = defaultdict(list)
-        for result in producer_results:
-            config = result.get('configuration', {})
-            key = self._config_to_key(config)
-            groups[key].append(result)
+        Args:
+            records: Result records of one test type
+            metric_keys: Metric keys held in each record's metrics tuple
 
-        # Calculate statistics for each group
-        aggregated = {}
-        for key, results in groups.items():
-            metrics_list = [r.get('metrics', {}) for r in results]
+        Returns:
+            DataFrame with one row per result and one column per metric
+        """
+        # Format each distinct configuration's display key only once, and keep
+        # one configuration per key rather than one per row
+        labels: Dict[Tuple[Any, ...], str] = {}
+        configurations = self._configurations[records[0].test_type]
+
+        # One pass over the records fills every column
+        config_keys = []
+        metric_rows = []
+        for record in records:
+            label = labels.get(record.config_key)
+            if label is None:
+                label = labels[record.config_key] = self._key_to_label(record.config_key)
+                configurations.setdefault(label, record.configuration)
+            config_keys.append(label)
+            metric_rows.append(record.metrics)
+
+        columns = {'config_key': config_keys}
+        values = np.array(metric_rows, dtype=np.float64)
+        for i, key in enumerate(metric_keys):
+            column = values[:, i]
+            # Zero means "not measured" for everything except rebalance time
+            if key != 'rebalance_time_ms':
+                column[column == 0] = np.nan
+            columns[key] = column
+
+        return pd.DataFrame(columns)
+
+    def _aggregate(
+        self, df: pd.DataFrame, metric_columns: Dict[str, str],
+        configurations: Dict[str, Dict[str, Any]]
+    ) -> Tuple[Dict[str, Dict[str, Any]], pd.DataFrame]:
+        """
+        Aggregate results by configuration with a single pandas groupby.
+
+        Args:
+            df: Flattened results of a single test type
+            metric_columns: Mapping of output metric name to DataFrame column
+            configurations: First configuration seen for each config key
 
-            throughput_mb = [m.get('throughput_mb', 0) for m in metrics_list if m.get('throughput_mb')]
-            throughput_rps = [m.get('throughput_rps', 0) for m in metrics_list if m.get('throughput_rps')]
-            avg_latency = [m.get('avg_latency_ms', 0) for m in metrics_list if m.get('avg_latency_ms')]
-            p99_latency = [m.get('p99_ms', 0) for m in metrics_list if m.get('p99_ms')]
+        Returns:
+            Tuple of (dictionary mapping config keys to aggregated statistics,
+            DataFrame of per-config metric means indexed by config key)
+        """
+        metrics = df[list(metric_columns.values())].set_axis(list(metric_columns), axis=1)
+        grouped = metrics.groupby(df['config_key'], dropna=False, observed=True, sort=False)
+
+        test_counts = grouped.size()
+        means = grouped.mean()
+
+        # Every percentile of a single run is the value itself, so only the
+        # configurations with repeated runs need a (sorting) quantile
+        repeated = df['config_key'].map(test_counts).to_numpy(dtype=np.int64) > 1
+
+        if NUMBA_AVAILABLE and np.count_nonzero(repeated) >= self.NUMBA_PERCENTILE_MIN_ROWS:
+            group_percentiles = _jit_group_percentiles()
+            codes = grouped.ngroup().to_numpy(dtype=np.int64)
+            quantiles = np.array([0.5, 0.95, 0.99])
+            columns = {
+                name: group_percentiles(
+                    codes, np.ascontiguousarray(metrics[name].to_numpy(dtype=np.float64)), len(means), quantiles
+                )
+                for name in metrics.columns
+            }
+            percentiles = {
+                name: pd.DataFrame({col: values[:, j] for col, values in columns.items()}, index=means.index)
+                for j, name in enumerate(('p50', 'p95', 'p99'))
+            }
+        else:
+            percentiles = {name: means for name in ('p50', 'p95', 'p99')}
+            if repeated.any():
+                quantiles = metrics[repeated].groupby(
+                    df['config_key'][repeated], dropna=False, observed=True, sort=False
+                ).quantile([0.5, 0.95, 0.99])
+                for name, q in (('p50', 0.5), ('p95', 0.95), ('p99', 0.99)):
+                    percentiles[name] = quantiles.xs(q, level=-1).reindex(means.index).fillna(means)
+
+        table = pd.concat({
+            'mean': means,
+            'std': grouped.std(ddof=0),
+            'min': grouped.min(),
+            'max': grouped.max(),
+            **percentiles,
+            'count': grouped.count(),
+        }, axis=1)
 
+        aggregated = {}
+        for key, row in zip(table.index, table.to_dict('records')):
             aggregated[key] = {
-                'configuration': results[0].get('configuration', {}),
-                'test_count': len(results),
-                'throughput_mb': self._calc_stats(throughput_mb),
-                'throughput_rps': self._calc_stats(throughput_rps),
-                'avg_latency_ms': self._calc_stats(avg_latency),
-                'p99_latency_ms': self._calc_stats(p99_latency),
+                'configuration': configurations[key],
+                'test_count': int(test_counts[key]),
             }
+            for name in metric_columns:
+                aggregated[key][name] = self._format_stats(row, name)
 
-        return aggregated
+        return aggregated, table['mean']
 
-    def aggregate_consumer_results(self) -> Dict[str, Dict[str, Any]]:
+    def _aggregate_results(self, test_type: str) -> Tuple[Dict[str, Dict[str, Any]], pd.DataFrame]:
         """
-        Aggregate consumer results by configuration.
+        Aggregate the loaded results of one test type.
+
+        Args:
+            test_type: 'producer' or 'consumer'
 
         Returns:
-            Dictionary mapping config keys to aggregated statistics
+            Same as _aggregate, empty when there are no results
         """
-        consumer_results = [
-            r for r in self.all_results
-            if r.get('test_type') == 'consumer'
-        ]
+        metric_columns = self._TYPE_METRICS[test_type]
+        chunks = self._chunks[test_type]
+        if not chunks:
+            return {}, pd.DataFrame(columns=list(metric_columns), dtype=np.float64)
 
-        if not consumer_results:
-            return {}
+        return self._aggregate(chunks[0], metric_columns, self._configurations[test_type])
 
-        # Group by configuration
-        groups = defaultdict(list)
-        for result in consumer_results:
-            config = result.get('configuration', {})
-            key = self._config_to_key(config)
-            groups[key].append(result)
+    def _type_count(self, test_type: str) -> int:
+        """Return the number of loaded results of one test type."""
+        chunks = self._chunks[test_type]
+        return len(chunks[0]) if chunks else 0
 
-        # Calculate statistics for each group
-        aggregated = {}
-        for key, results in groups.items():
-            metrics_list = [r.get('metrics', {}) for r in results]
+    def aggregate_producer_results(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate producer results by configuration.
 
-            throughput_mb = [m.get('throughput_mb_sec', 0) for m in metrics_list if m.get('throughput_mb_sec')]
-            throughput_msg = [m.get('throughput_msg_sec', 0) for m in metrics_list if m.get('throughput_msg_sec')]
-            rebalance_time = [m.get('rebalance_time_ms', 0) for m in metrics_list if m.get('rebalance_time_ms') is not None]
+        Returns:
+            Dictionary mapping config keys to aggregated statistics
+        """
+        return self._aggregate_results('producer')[0]
 
-            aggregated[key] = {
-                'configuration': results[0].get('configuration', {}),
-                'test_count': len(results),
-                'throughput_mb_sec': self._calc_stats(throughput_mb),
-                'throughput_msg_sec': self._calc_stats(throughput_msg),
-                'rebalance_time_ms': self._calc_stats(rebalance_time),
-            }
+    def aggregate_consumer_results(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregate consumer results by configuration.
 
-        return aggregated
+        Returns:
+            Dictionary mapping config keys to aggregated statistics
+        """
+        return self._aggregate_results('consumer')[0]
 
-    def _calc_stats(self, values: List[float]) -> Dict[str, float]:
+    def _format_stats(self, row: Dict[Any, float], metric: str) -> Dict[str, Optional[float]]:
         """
-        Calculate statistics for a list of values.
+        Convert one metric's aggregated values into a statistics dictionary.
 
         Args:
-            values: List of numeric values
+            row: Aggregated table row keyed by (statistic, metric), holding
+                native Python floats from DataFrame.to_dict
+            metric: Metric name
 
         Returns:
             Dictionary with statistical measures
         """
-        if not values:
+        count = int(row[('count', metric)])
+        if not count:
             return {
                 'mean': None,
                 'std': None,
@@ -225,16 +539,15 @@ class ResultsAggregator:
                 'count': 0
             }
 
-        arr = np.array(values)
         return {
-            'mean': float(np.mean(arr)),
-            'std': float(np.std(arr)),
-            'min': float(np.min(arr)),
-            'max': float(np.max(arr)),
-            'p50': float(np.percentile(arr, 50)),
-            'p95': float(np.percentile(arr, 95)),
-            'p99': float(np.percentile(arr, 99)),
-            'count': len(values)
+            'mean': row[('mean', metric)],
+            'std': row[('std', metric)],
+            'min': row[('min', metric)],
+            'max': row[('max', metric)],
+            'p50': row[('p50', metric)],
+            'p95': row[('p95', metric)],
+            'p99': row[('p99', metric)],
+            'count': count
         }
 
     def generate_summary(self) -> Dict[str, Any]:
@@ -244,34 +557,29 @@ class ResultsAggregator:
         Returns:
             Dictionary containing full aggregation summary
         """
-        producer_agg = self.aggregate_producer_results()
-        consumer_agg = self.aggregate_consumer_results()
+        if self._summary_cache is not None:
+            return self._summary_cache
+
+        aggregations = {test_type: self._aggregate_results(test_type) for test_type in self._TYPE_METRICS}
+        producer_agg, producer_means = aggregations['producer']
+        consumer_agg, consumer_means = aggregations['consumer']
 
-        # Find best configurations
+        # Find best configurations (ties resolve to the first config seen)
         best_producer_throughput = None
         best_producer_latency = None
 
         if producer_agg:
             # Best throughput
-            best_key = max(
-                producer_agg.keys(),
-                key=lambda k: producer_agg[k]['throughput_mb'].get('mean', 0) or 0
-            )
+            best_key = producer_means['throughput_mb'].fillna(0).idxmax()
             best_producer_throughput = {
                 'config_key': best_key,
                 **producer_agg[best_key]
             }
 
             # Best latency
-            valid_latency = {
-                k: v for k, v in producer_agg.items()
-                if v['avg_latency_ms'].get('mean') is not None
-            }
-            if valid_latency:
-                best_key = min(
-                    valid_latency.keys(),
-                    key=lambda k: valid_latency[k]['avg_latency_ms'].get('mean', float('inf'))
-                )
+            latency = producer_means['avg_latency_ms']
+            if latency.notna().any():
+                best_key = latency.idxmin()
                 best_producer_latency = {
                     'config_key': best_key,
                     **producer_agg[best_key]
@@ -279,20 +587,17 @@ class ResultsAggregator:
 
         best_consumer_throughput = None
         if consumer_agg:
-            best_key = max(
-                consumer_agg.keys(),
-                key=lambda k: consumer_agg[k]['throughput_mb_sec'].get('mean', 0) or 0
-            )
+            best_key = consumer_means['throughput_mb_sec'].fillna(0).idxmax()
             best_consumer_throughput = {
                 'config_key': best_key,
                 **consumer_agg[best_key]
             }
 
-        return {
+        self._summary_cache = {
             'summary': {
-                'total_results': len(self.all_results),
-                'producer_results': len([r for r in self.all_results if r.get('test_type') == 'producer']),
-                'consumer_results': len([r for r in self.all_results if r.get('test_type') == 'consumer']),
+                'total_results': self.result_count,
+                'producer_results': self._type_count('producer'),
+                'consumer_results': self._type_count('consumer'),
                 'unique_producer_configs': len(producer_agg),
                 'unique_consumer_configs': len(consumer_agg),
                 'aggregation_time': datetime.now().isoformat(),
@@ -305,6 +610,7 @@ class ResultsAggregator:
             'producer_aggregations': producer_agg,
             'consumer_aggregations': consumer_agg,
         }
+        return self._summary_cache
 
     def export_to_json(self, output_file: str) -> str:
         """
@@ -321,8 +627,15 @@ class ResultsAggregator:
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
 
-        with open(output_path, 'w', encoding='utf-8') as f:
-            json.dump(summary, f, indent=2, default=str)
+        if orjson:
+            output_path.write_bytes(orjson.dumps(
+                summary,
+                default=str,
+                option=orjson.OPT_INDENT_2 | orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS,
+            ))
+        else:
+            with open(output_path, 'w', encoding='utf-8') as f:
+                json.dump(summary, f, indent=2, default=str)
 
         self.log(f"Exported aggregated results to: {output_path}")
         return str(output_path)
@@ -339,44 +652,47 @@ class ResultsAggregator:
         """
         summary = self.generate_summary()
 
-        # Flatten producer aggregations
-        rows = []
+        producer_agg = summary.get('producer_aggregations', {})
+        consumer_agg = summary.get('consumer_aggregations', {})
 
-        for key, data in summary.get('producer_aggregations', {}).items():
+        # Fill pre-sized columns positionally; cells a test type does not use stay empty
+        names = list(self.PRODUCER_CSV_COLUMNS) if producer_agg else []
+        if consumer_agg:
+            names += [name for name in self.CONSUMER_CSV_COLUMNS if name not in names]
+        size = len(producer_agg) + len(consumer_agg)
+        columns = {name: [None] * size for name in names}
+
+        for i, (key, data) in enumerate(producer_agg.items()):
             config = data.get('configuration', {})
             throughput = data.get('throughput_mb', {})
             latency = data.get('avg_latency_ms', {})
 
-            rows.append({
-                'test_type': 'producer',
-                'config_key': key,
-                'acks': config.get('acks', ''),
-                'batch_size': config.get('batch_size', ''),
-                'linger_ms': config.get('linger_ms', ''),
-                'compression': config.get('compression_type', config.get('compression', '')),
-                'record_size': config.get('record_size', ''),
-                'test_count': data.get('test_count', 0),
-                'throughput_mb_mean': throughput.get('mean', ''),
-                'throughput_mb_std': throughput.get('std', ''),
-                'latency_ms_mean': latency.get('mean', ''),
-                'latency_ms_std': latency.get('std', ''),
-            })
-
-        for key, data in summary.get('consumer_aggregations', {}).items():
+            columns['test_type'][i] = 'producer'
+            columns['config_key'][i] = key
+            columns['acks'][i] = config.get('acks', '')
+            columns['batch_size'][i] = config.get('batch_size', '')
+            columns['linger_ms'][i] = config.get('linger_ms', '')
+            columns['compression'][i] = config.get('compression_type', config.get('compression', ''))
+            columns['record_size'][i] = config.get('record_size', '')
+            columns['test_count'][i] = data.get('test_count', 0)
+            columns['throughput_mb_mean'][i] = throughput.get('mean', '')
+            columns['throughput_mb_std'][i] = throughput.get('std', '')
+            columns['latency_ms_mean'][i] = latency.get('mean', '')
+            columns['latency_ms_std'][i] = latency.get('std', '')
+
+        for i, (key, data) in enumerate(consumer_agg.items(), start=len(producer_agg)):
             config = data.get('configuration', {})
             throughput = data.get('throughput_mb_sec', {})
 
-            rows.append({
-                'test_type': 'consumer',
-                'config_key': key,
-                'fetch_min_bytes': config.get('fetch_min_bytes', ''),
-                'max_poll_records': config.get('max_poll_records', ''),
-                'test_count': data.get('test_count', 0),
-                'throughput_mb_mean': throughput.get('mean', ''),
-                'throughput_mb_std': throughput.get('std', ''),
-            })
-
-        df = pd.DataFrame(rows)
+            columns['test_type'][i] = 'consumer'
+            columns['config_key'][i] = key
+            columns['fetch_min_bytes'][i] = config.get('fetch_min_bytes', '')
+            columns['max_poll_records'][i] = config.get('max_poll_records', '')
+            columns['test_count'][i] = data.get('test_count', 0)
+            columns['throughput_mb_mean'][i] = throughput.get('mean', '')
+            columns['throughput_mb_std'][i] = throughput.get('std', '')
+
+        df = pd.DataFrame(columns, columns=names, copy=False)
 
         output_path = Path(output_file)
         output_path.parent.mkdir(parents=True, exist_ok=True)
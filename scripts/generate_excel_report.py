@@ -30,28 +30,24 @@ Sheets Generated:
 
 import json
 import argparse
+import importlib.util
 import sys
+from concurrent.futures import ProcessPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from copy import copy
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Any, Optional, Tuple
-from statistics import mean, stdev
+from functools import cached_property
+from typing import Dict, List, Any, Optional
 
 try:
     import openpyxl
-    from openpyxl.chart import (
-        LineChart, BarChart, ScatterChart, Reference, AreaChart,
-        RadarChart, BubbleChart, Series
-    )
-    from openpyxl.chart.series import DataPoint
-    from openpyxl.chart.label import DataLabelList
-    from openpyxl.chart.shapes import GraphicalProperties
+    from openpyxl.chart import LineChart, BarChart, ScatterChart, AreaChart, Reference
     from openpyxl.chart.marker import Marker
     from openpyxl.chart.trendline import Trendline
-    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, Color
-    from openpyxl.formatting.rule import ColorScaleRule, FormulaRule
-    from openpyxl.utils.dataframe import dataframe_to_rows
+    from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+    from openpyxl.cell import WriteOnlyCell
     from openpyxl.utils import get_column_letter
-    from openpyxl.drawing.text import Paragraph, ParagraphProperties, CharacterProperties
 except ImportError:
     print("[ERROR] openpyxl is required. Install with: pip install openpyxl")
     sys.exit(1)
@@ -65,7 +61,41 @@ except ImportError:
 try:
     import numpy as np
 except ImportError:
-    np = None  # Optional, will use pure Python fallbacks
+    print("[ERROR] numpy is required. Install with: pip install numpy")
+    sys.exit(1)
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional, falls back to the standard library json module
+
+try:
+    import xlsxwriter
+except ImportError:
+    xlsxwriter = None  # Optional, speeds up --split-raw
+
+# Optional, JIT-compiles groupby means on large result sets. Only probed here:
+# pandas imports numba itself the first time the numba engine runs, so small
+# reports skip its import cost
+NUMBA_AVAILABLE = importlib.util.find_spec('numba') is not None
+
+
+def _classify_zones(throughput, latency):
+    """
+    Classify each result into a trade-off performance zone.
+
+    Args:
+        throughput: Array of throughput values in MB/sec
+        latency: Array of average latencies in ms
+
+    Returns:
+        int8 array of zone codes: 0 = Safe, 1 = Diminishing, 2 = Saturation
+    """
+    return np.select(
+        [(throughput < 50) & (latency < 1000), throughput < 90],
+        [0, 1],
+        default=2,
+    ).astype(np.int8)
 
 
 class KafkaPerformanceReporter:
@@ -91,6 +121,38 @@ class KafkaPerformanceReporter:
     SUBTITLE_FONT = Font(bold=True, size=14, color="2E75B6")
     SECTION_FONT = Font(bold=True, size=12, color="1F4E79")
     METRIC_FONT = Font(bold=True, size=11)
+    BOLD_FONT = Font(bold=True)
+    SUBHEADING_FONT = Font(bold=True, size=12)
+    NOTE_FONT = Font(italic=True, color="666666")
+    WARNING_FONT = Font(bold=True, italic=True, color="C00000")
+    ALERT_FONT = Font(bold=True, color="FF0000")
+    # Explicitly black counterpart of ALERT_FONT for values below the alert threshold
+    NO_ALERT_FONT = Font(bold=True, color="000000")
+    CENTER_ALIGNMENT = Alignment(horizontal='center', vertical='center')
+
+    # Dashboard banner and KPI box styles
+    DASHBOARD_TITLE_FONT = Font(bold=True, size=18, color="FFFFFF")
+    DASHBOARD_NOTE_FONT = Font(italic=True, size=10, color="666666")
+    KPI_HEADER_FILL = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
+    KPI_HEADER_FONT = Font(bold=True, size=11, color="FFFFFF")
+    KPI_VALUE_GREEN = Font(bold=True, size=20, color="00B050")
+    KPI_VALUE_RED = Font(bold=True, size=20, color="FF6B6B")
+    KPI_VALUE_BLUE = Font(bold=True, size=14, color="4472C4")
+    KPI_SCALING_BAD = Font(bold=True, size=14, color="FF6B6B")
+    KPI_SCALING_WARN = Font(bold=True, size=14, color="FFD93D")
+    KPI_LABEL_FONT = Font(size=11)
+    KPI_DETAIL_FONT = Font(size=10)
+    KPI_VALUE_META = Font(size=9, color="666666")
+    KPI_DETAIL_META = Font(size=10, color="666666")
+
+    # Recommendation banners
+    BANNER_FONT = Font(bold=True, size=12, color="FFFFFF")
+    BANNER_GREEN_FILL = PatternFill(start_color="6BCB77", end_color="6BCB77", fill_type="solid")
+    BANNER_GREY_FILL = PatternFill(start_color="666666", end_color="666666", fill_type="solid")
+
+    # Heatmap legend fills
+    HEATMAP_HIGH_FILL = PatternFill(start_color="64FF50", end_color="64FF50", fill_type="solid")
+    HEATMAP_LOW_FILL = PatternFill(start_color="FF6450", end_color="FF6450", fill_type="solid")
 
     # Status fills
     GOOD_FILL = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
@@ -104,6 +166,11 @@ class KafkaPerformanceReporter:
         'all': '6BCB77',    # Green - safe but slow
         '-1': '6BCB77',     # Same as 'all'
     }
+    ACKS_FILLS = {
+        acks: PatternFill(start_color=color, end_color=color, fill_type="solid")
+        for acks, color in ACKS_COLORS.items()
+    }
+    UNKNOWN_ACKS_FILL = PatternFill(start_color="FFFFFF", end_color="FFFFFF", fill_type="solid")
 
     # Throughput zone colors
     ZONE_COLORS = {
@@ -114,6 +181,18 @@ class KafkaPerformanceReporter:
         'critical': '8B0000',   # Dark red
     }
 
+    # Rows sampled per column when sizing column widths
+    AUTO_WIDTH_SAMPLE_ROWS = 1000
+
+    # Groupby means switch to the numba engine above this many rows; below it
+    # the one-off JIT compile costs more than the aggregation itself
+    NUMBA_AGG_MIN_ROWS = 100000
+    NUMBA_AGG_KWARGS = {'engine': 'numba', 'engine_kwargs': {'nopython': True, 'parallel': False}}
+
+    # Trade-off zones, indexed by the codes returned from _classify_zones
+    ZONE_LABELS = ('Safe', 'Diminishing', 'Saturation')
+    ZONE_FILLS = (GOOD_FILL, NEUTRAL_FILL, BAD_FILL)
+
     # Chart style settings
     CHART_STYLE = 13  # Modern Excel chart style
     CHART_BG_COLOR = 'F5F5F5'
@@ -131,7 +210,8 @@ class KafkaPerformanceReporter:
         bottom=Side(style='medium')
     )
 
-    def __init__(self, parsed_json_file: str, output_xlsx: str, verbose: bool = False):
+    def __init__(self, parsed_json_file: str, output_xlsx: str, verbose: bool = False,
+                 split_raw: bool = False):
         """
         Initialize the reporter.
 
@@ -139,9 +219,13 @@ class KafkaPerformanceReporter:
             parsed_json_file: Path to parsed JSON results file
             output_xlsx: Path for output Excel file
             verbose: Enable verbose output
+            split_raw: Write Raw Data to a sibling .raw.xlsx file
         """
         self.output_file = Path(output_xlsx)
         self.verbose = verbose
+        self.split_raw = split_raw
+        self._fill_cache: Dict[str, PatternFill] = {}
+        self._raw_data_job = None
 
         # Load parsed data
         self.data = self._load_parsed_data(parsed_json_file)
@@ -150,73 +234,142 @@ class KafkaPerformanceReporter:
         self.wb = openpyxl.Workbook()
         self.wb.remove(self.wb.active)  # Remove default sheet
 
-        # Organize data by test type
-        self.producer_results = [r for r in self.data if r.get('test_type') == 'producer']
-        self.consumer_results = [r for r in self.data if r.get('test_type') == 'consumer']
+        # Organize data by test type in a single pass
+        self.producer_results: List[Dict[str, Any]] = []
+        self.consumer_results: List[Dict[str, Any]] = []
+        results_by_type = {'producer': self.producer_results, 'consumer': self.consumer_results}
+        for r in self.data:
+            bucket = results_by_type.get(r.get('test_type'))
+            if bucket is not None:
+                bucket.append(r)
+        self.has_producer = bool(self.producer_results)
+        self.has_consumer = bool(self.consumer_results)
 
         self.log(f"Loaded {len(self.producer_results)} producer results")
         self.log(f"Loaded {len(self.consumer_results)} consumer results")
 
-        # Create DataFrames for analysis
-        self.producer_df = self._create_producer_dataframe()
-        self.consumer_df = self._create_consumer_dataframe()
-
-        # Pre-calculate scores and statistics
-        self.scores = self._calculate_all_scores()
-        self.stats = self._calculate_statistics()
-
-    def _create_producer_dataframe(self) -> pd.DataFrame:
+    @cached_property
+    def producer_df(self) -> pd.DataFrame:
         """Convert producer results to DataFrame for analysis and charting."""
         if not self.producer_results:
             return pd.DataFrame()
 
-        rows = []
-        for r in self.producer_results:
-            config = r.get('configuration', {})
-            metrics = r.get('metrics', {})
-            rows.append({
-                'scenario': r.get('scenario', 'unknown'),
-                'acks': str(config.get('acks', '')),
-                'batch_size': config.get('batch_size', 0),
-                'linger_ms': config.get('linger_ms', 0),
-                'compression_type': config.get('compression_type', config.get('compression', 'none')),
-                'record_size': config.get('record_size', 1024),
-                'num_producers': config.get('num_producers', 1),
-                'throughput_rps': metrics.get('throughput_rps', 0),
-                'throughput_mb': metrics.get('throughput_mb', 0),
-                'avg_latency_ms': metrics.get('avg_latency_ms', 0),
-                'max_latency_ms': metrics.get('max_latency_ms', 0),
-                'p50_ms': metrics.get('p50_ms', 0),
-                'p95_ms': metrics.get('p95_ms', 0),
-                'p99_ms': metrics.get('p99_ms', 0),
-                'p999_ms': metrics.get('p999_ms', 0),
-            })
-        return pd.DataFrame(rows)
+        results = self.producer_results
+        configs = [r.get('configuration', {}) for r in results]
+        metrics = [r.get('metrics', {}) for r in results]
+        return pd.DataFrame({
+            'scenario': [r.get('scenario', 'unknown') for r in results],
+            'acks': [str(c.get('acks', '')) for c in configs],
+            'batch_size': [c.get('batch_size', 0) for c in configs],
+            'linger_ms': [c.get('linger_ms', 0) for c in configs],
+            'compression_type': [c.get('compression_type', c.get('compression', 'none')) for c in configs],
+            'record_size': [c.get('record_size', 1024) for c in configs],
+            'num_producers': [c.get('num_producers', 1) for c in configs],
+            'throughput_rps': [m.get('throughput_rps', 0) for m in metrics],
+            'throughput_mb': [m.get('throughput_mb', 0) for m in metrics],
+            'avg_latency_ms': [m.get('avg_latency_ms', 0) for m in metrics],
+            'max_latency_ms': [m.get('max_latency_ms', 0) for m in metrics],
+            'p50_ms': [m.get('p50_ms', 0) for m in metrics],
+            'p95_ms': [m.get('p95_ms', 0) for m in metrics],
+            'p99_ms': [m.get('p99_ms', 0) for m in metrics],
+            'p999_ms': [m.get('p999_ms', 0) for m in metrics],
+        })
+
+    def _group_producer_means(self, key: str) -> pd.DataFrame:
+        """
+        Average the headline producer metrics per value of a configuration column.
+
+        Args:
+            key: Producer DataFrame column to group by
+
+        Returns:
+            DataFrame with the key column followed by the mean metrics, sorted by key
+        """
+        if self.producer_df.empty or key not in self.producer_df.columns:
+            return pd.DataFrame()
 
-    def _create_consumer_dataframe(self) -> pd.DataFrame:
+        columns = ['throughput_mb', 'avg_latency_ms', 'p99_ms']
+        grouped = self.producer_df.groupby(key, sort=True)[columns]
+        # The numba mean divides by zero on all-NaN groups, so it only takes
+        # frames without missing metrics
+        if (NUMBA_AVAILABLE and len(self.producer_df) > self.NUMBA_AGG_MIN_ROWS
+                and not self.producer_df[columns].isna().to_numpy().any()):
+            return grouped.mean(**self.NUMBA_AGG_KWARGS).reset_index()
+        return grouped.mean().reset_index()
+
+    @cached_property
+    def _producer_scaling_df(self) -> pd.DataFrame:
+        """Producer means per num_producers, shared by the dashboard, statistics and sheets."""
+        return self._group_producer_means('num_producers')
+
+    @cached_property
+    def _producer_acks_df(self) -> pd.DataFrame:
+        """Producer means per acks setting, shared by the dashboard and sheets."""
+        return self._group_producer_means('acks')
+
+    @cached_property
+    def _producer_batch_df(self) -> pd.DataFrame:
+        """Producer means per batch_size, used by the throughput sheet."""
+        return self._group_producer_means('batch_size')
+
+    @cached_property
+    def _producer_compression_df(self) -> pd.DataFrame:
+        """Producer means per compression_type, used by the throughput sheet."""
+        return self._group_producer_means('compression_type')
+
+    @staticmethod
+    def _top_n(df: pd.DataFrame, n: int, column: str) -> pd.DataFrame:
+        """
+        Select the n rows with the largest values in a column.
+
+        Matches DataFrame.nlargest(n, column), ties kept in row order, but
+        selects with np.partition instead of sorting the whole column.
+
+        Args:
+            df: DataFrame to select from
+            n: Number of rows to return
+            column: Numeric column to rank by
+
+        Returns:
+            Selected rows in descending order of the column
+        """
+        values = df[column].to_numpy(dtype=float)
+        missing = np.isnan(values)
+        valid = np.flatnonzero(~missing)
+        k = min(n, len(valid))
+        if k < len(valid):
+            kth = np.partition(values[valid], len(valid) - k)[len(valid) - k]
+            valid = valid[values[valid] >= kth]
+        order = valid[np.argsort(-values[valid], kind='stable')][:k]
+        if k < n:
+            # Like nlargest, pad with missing values once real ones run out
+            order = np.concatenate([order, np.flatnonzero(missing)[:n - k]])
+        return df.iloc[order]
+
+    @cached_property
+    def consumer_df(self) -> pd.DataFrame:
         """Convert consumer results to DataFrame for analysis and charting."""
         if not self.consumer_results:
             return pd.DataFrame()
 
-        rows = []
-        for r in self.consumer_results:
-            config = r.get('configuration', {})
-            metrics = r.get('metrics', {})
-            rows.append({
-                'scenario': r.get('scenario', 'unknown'),
-                'fetch_min_bytes': config.get('fetch_min_bytes', 0),
-                'max_poll_records': config.get('max_poll_records', 500),
-                'num_consumers': config.get('num_consumers', 1),
-                'throughput_mb_sec': metrics.get('throughput_mb_sec', 0),
-                'throughput_msg_sec': metrics.get('throughput_msg_sec', 0),
-                'data_consumed_mb': metrics.get('data_consumed_mb', 0),
-                'rebalance_time_ms': metrics.get('rebalance_time_ms', 0),
-                'fetch_time_ms': metrics.get('fetch_time_ms', 0),
-                'fetch_mb_sec': metrics.get('fetch_mb_sec', 0),
-            })
-        return pd.DataFrame(rows)
-
-    def _calculate_all_scores(self) -> Dict[str, Any]:
+        results = self.consumer_results
+        configs = [r.get('configuration', {}) for r in results]
+        metrics = [r.get('metrics', {}) for r in results]
+        return pd.DataFrame({
+            'scenario': [r.get('scenario', 'unknown') for r in results],
+            'fetch_min_bytes': [c.get('fetch_min_bytes', 0) for c in configs],
+            'max_poll_records': [c.get('max_poll_records', 500) for c in configs],
+            'num_consumers': [c.get('num_consumers', 1) for c in configs],
+            'throughput_mb_sec': [m.get('throughput_mb_sec', 0) for m in metrics],
+            'throughput_msg_sec': [m.get('throughput_msg_sec', 0) for m in metrics],
+            'data_consumed_mb': [m.get('data_consumed_mb', 0) for m in metrics],
+            'rebalance_time_ms': [m.get('rebalance_time_ms', 0) for m in metrics],
+            'fetch_time_ms': [m.get('fetch_time_ms', 0) for m in metrics],
+            'fetch_mb_sec': [m.get('fetch_mb_sec', 0) for m in metrics],
+        })
+
+    @cached_property
+    def scores(self) -> Dict[str, Any]:
         """
         Calculate performance scores for all configurations.
 
@@ -236,49 +389,69 @@ class KafkaPerformanceReporter:
         max_throughput = df['throughput_mb'].max() if df['throughput_mb'].max() > 0 else 1
         max_latency = df['avg_latency_ms'].max() if df['avg_latency_ms'].max() > 0 else 1
 
+        throughput = df['throughput_mb'].to_numpy(dtype=np.float64)
+        avg_latency = df['avg_latency_ms'].to_numpy(dtype=np.float64)
+        p99 = df['p99_ms'].to_numpy(dtype=np.float64)
+
         # Calculate individual scores
-        df['throughput_score'] = (df['throughput_mb'] / max_throughput) * 100
-        df['latency_score'] = 100 - ((df['avg_latency_ms'] / max_latency) * 100)
-
-        # Consistency score based on p99/avg ratio (lower is more consistent)
-        df['consistency_score'] = df.apply(
-            lambda row: max(0, 100 - ((row['p99_ms'] / row['avg_latency_ms'] - 1) * 50))
-            if row['avg_latency_ms'] > 0 else 50,
-            axis=1
-        )
+        throughput_score = (throughput / max_throughput) * 100
+        latency_score = 100 - ((avg_latency / max_latency) * 100)
+
+        # Consistency score based on p99/avg ratio (lower is more consistent);
+        # 50 where there is no positive average latency to compare against
+        safe = avg_latency > 0
+        ratio = np.divide(p99, avg_latency, out=np.zeros_like(avg_latency), where=safe)
+        consistency_score = np.where(safe, np.fmax(0, 100 - ((ratio - 1) * 50)), 50.0)
+
+        df['throughput_score'] = throughput_score
+        df['latency_score'] = latency_score
+        df['consistency_score'] = consistency_score
 
         # Calculate weighted scores for different use cases
         # Max Throughput: 40% throughput + 20% latency + 40% consistency
         df['score_max_throughput'] = (
-            0.4 * df['throughput_score'] +
-            0.2 * df['latency_score'] +
-            0.4 * df['consistency_score']
+            0.4 * throughput_score +
+            0.2 * latency_score +
+            0.4 * consistency_score
         )
 
         # Balanced: 30% throughput + 35% latency + 35% consistency
         df['score_balanced'] = (
-            0.3 * df['throughput_score'] +
-            0.35 * df['latency_score'] +
-            0.35 * df['consistency_score']
+            0.3 * throughput_score +
+            0.35 * latency_score +
+            0.35 * consistency_score
         )
 
         # Durability: 20% throughput + 35% latency + 45% consistency
         df['score_durability'] = (
-            0.2 * df['throughput_score'] +
-            0.35 * df['latency_score'] +
-            0.45 * df['consistency_score']
+            0.2 * throughput_score +
+            0.35 * latency_score +
+            0.45 * consistency_score
         )
 
+        best_throughput_idx = df['throughput_mb'].idxmax() if not df.empty else None
+        best_latency_idx = df['avg_latency_ms'].idxmin() if not df.empty else None
+        best_balanced_idx = df['score_balanced'].idxmax() if not df.empty else None
+
+        # Best rows as plain dicts so the dashboard and recommendations
+        # don't repeat the .loc lookups
+        def best_row(idx):
+            return df.loc[idx].to_dict() if idx is not None else None
+
         return {
             'scored_df': df,
             'max_throughput': max_throughput,
             'max_latency': max_latency,
-            'best_throughput_idx': df['throughput_mb'].idxmax() if not df.empty else None,
-            'best_latency_idx': df['avg_latency_ms'].idxmin() if not df.empty else None,
-            'best_balanced_idx': df['score_balanced'].idxmax() if not df.empty else None,
+            'best_throughput_idx': best_throughput_idx,
+            'best_latency_idx': best_latency_idx,
+            'best_balanced_idx': best_balanced_idx,
+            'best_throughput_row': best_row(best_throughput_idx),
+            'best_latency_row': best_row(best_latency_idx),
+            'best_balanced_row': best_row(best_balanced_idx),
         }
 
-    def _calculate_statistics(self) -> Dict[str, Any]:
+    @cached_property
+    def stats(self) -> Dict[str, Any]:
         """Calculate aggregate statistics for dashboard and analysis."""
         stats = {
             'producer': {},
@@ -297,13 +470,14 @@ class KafkaPerformanceReporter:
                 'test_count': len(df),
             }
 
-            # Scaling analysis - group by num_producers
-            if 'num_producers' in df.columns:
-                scaling_data = df.groupby('num_producers').agg({
-                    'throughput_mb': 'mean',
-                    'avg_latency_ms': 'mean',
-                }).reset_index()
-                stats['scaling']['producer'] = scaling_data.to_dict('records')
+            # Scaling analysis - (num_producers, throughput_mb, avg_latency_ms) per producer count
+            if not self._producer_scaling_df.empty:
+                scaling_data = self._producer_scaling_df
+                stats['scaling']['producer'] = list(zip(
+                    scaling_data['num_producers'].to_list(),
+                    scaling_data['throughput_mb'].to_list(),
+                    scaling_data['avg_latency_ms'].to_list(),
+                ))
 
         if not self.consumer_df.empty:
             df = self.consumer_df
@@ -329,8 +503,12 @@ class KafkaPerformanceReporter:
             print(f"[ERROR] JSON file not found: {json_file}")
             sys.exit(1)
 
-        with open(json_path, 'r', encoding='utf-8') as f:
-            data = json.load(f)
+        if orjson:
+            with open(json_path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(json_path, 'r', encoding='utf-8') as f:
+                data = json.load(f)
 
         # Handle both single result and list of results
         if isinstance(data, dict):
@@ -396,32 +574,219 @@ class KafkaPerformanceReporter:
         self.wb.save(self.output_file)
         self.log(f"Report saved to: {self.output_file}")
 
+        self._finish_split_raw_data()
+
         return str(self.output_file)
 
+    def _solid_fill(self, color: str) -> PatternFill:
+        """Return a shared solid PatternFill for a hex color."""
+        fill = self._fill_cache.get(color)
+        if fill is None:
+            fill = self._fill_cache[color] = PatternFill(start_color=color, end_color=color, fill_type="solid")
+        return fill
+
+    def _heatmap_pivot(self, values: str, columns: str) -> pd.DataFrame:
+        """
+        Mean of a producer metric per acks (rows) and another parameter (columns).
+
+        Equivalent to pivot_table(aggfunc='mean') without its dispatch
+        overhead: groups with no values are dropped before unstacking, so the
+        result keeps the same rows and columns.
+
+        Args:
+            values: Producer metric column to average
+            columns: Producer parameter column to spread across the heatmap
+
+        Returns:
+            DataFrame indexed by acks with one column per parameter value
+        """
+        means = self.producer_df.groupby(['acks', columns])[values].mean().dropna()
+        return means.unstack(columns)
+
+    def _heatmap_fills(self, heat: np.ndarray) -> List[List[Optional[PatternFill]]]:
+        """
+        Resolve red-to-green heatmap fills for a grid of heat values.
+
+        Args:
+            heat: 2-D array scaled so 0 is the worst value and 1 the best, NaN where empty
+
+        Returns:
+            Nested lists of fills matching heat, None for empty cells
+        """
+        missing = np.isnan(heat)
+        intensity = (np.where(missing, 0.0, heat) * 155).astype(np.int64) + 100
+        return [
+            [None if is_missing else self._solid_fill(f"{255 - level:02X}{level:02X}50")
+             for level, is_missing in zip(levels, missing_row)]
+            for levels, missing_row in zip(intensity.tolist(), missing.tolist())
+        ]
+
     def _apply_header_style(self, ws, row: int, start_col: int, end_col: int) -> None:
         """Apply header styling to a row."""
-        for col in range(start_col, end_col + 1):
-            cell = ws.cell(row=row, column=col)
-            cell.fill = self.HEADER_FILL
-            cell.font = self.HEADER_FONT
-            cell.alignment = Alignment(horizontal='center', vertical='center')
-            cell.border = self.BORDER
+        # Style the first cell once and share its style array with the rest
+        # of the row instead of re-registering each style object per cell
+        first = ws.cell(row=row, column=start_col)
+        first.fill = self.HEADER_FILL
+        first.font = self.HEADER_FONT
+        first.alignment = self.CENTER_ALIGNMENT
+        first.border = self.BORDER
+        for col in range(start_col + 1, end_col + 1):
+            ws.cell(row=row, column=col)._style = copy(first._style)
+
+    def _write_header_row(self, ws, row: int, headers, start_col: int = 1) -> None:
+        """
+        Write a row of table headers with the header fill, font and border.
 
-    def _auto_width_columns(self, ws) -> None:
-        """Auto-adjust column widths based on content."""
-        for column in ws.columns:
-            max_length = 0
-            column_letter = get_column_letter(column[0].column)
+        Args:
+            ws: Worksheet to write to
+            row: Row number for the headers
+            headers: Header labels, written left to right
+            start_col: Column number of the first header
+        """
+        style = None
+        for col, header in enumerate(headers, start_col):
+            cell = ws.cell(row=row, column=col, value=header)
+            if style is None:
+                cell.fill = self.HEADER_FILL
+                cell.font = self.HEADER_FONT
+                cell.border = self.BORDER
+                style = cell._style
+            else:
+                cell._style = copy(style)
 
-            for cell in column:
-                try:
-                    if cell.value:
-                        max_length = max(max_length, len(str(cell.value)))
-                except:
-                    pass
+    @staticmethod
+    def _numeric_rows(df: pd.DataFrame, columns: List[str]):
+        """
+        Iterate rows of numeric columns as NumPy scalars.
+
+        Aggregated tables round their values with round(), which rounds
+        np.float64 differently from Python floats (e.g. 71.595 -> 71.6 vs
+        71.59). Keeping NumPy scalars, as the original row-wise loops did,
+        keeps the published figures unchanged.
+
+        Args:
+            df: DataFrame holding the columns
+            columns: Column names, in the order of each row's values
+
+        Returns:
+            Iterator of tuples, one per row
+        """
+        return zip(*(df[column].to_numpy() for column in columns))
+
+    def _write_table_rows(self, ws, start_row: int, rows) -> int:
+        """
+        Write rows of table values from column A, each cell with the table border.
+
+        The border is resolved once on the first cell and its style array is
+        shared with the rest, the same way header rows are styled.
+
+        Args:
+            ws: Worksheet to write to
+            start_row: Row number for the first data row
+            rows: Iterable of value sequences, one per row
+
+        Returns:
+            Row number following the last written row
+        """
+        style = None
+        row = start_row
+        for values in rows:
+            for col, value in enumerate(values, 1):
+                cell = ws.cell(row=row, column=col, value=value)
+                if style is None:
+                    cell.border = self.BORDER
+                    style = cell._style
+                else:
+                    cell._style = copy(style)
+            row += 1
+        return row
 
+    def _write_chart_data(self, ws, header_row: int, start_col: int, headers, rows) -> None:
+        """
+        Stage unstyled chart source data: a header row with value rows below it.
+
+        Args:
+            ws: Worksheet to write to
+            header_row: Row number for the series titles
+            start_col: Column number of the leftmost (category) column
+            headers: Series titles, one per column
+            rows: Iterable of value sequences, one per row
+        """
+        cell = ws.cell
+        for col, header in enumerate(headers, start_col):
+            cell(header_row, col, header)
+        for row, values in enumerate(rows, header_row + 1):
+            for col, value in enumerate(values, start_col):
+                cell(row, col, value)
+
+    @staticmethod
+    def _plot_staged_data(chart, ws, header_row: int, category_col: int, count: int,
+                          series_count: int = 1) -> None:
+        """
+        Add a block staged by _write_chart_data to a chart.
+
+        Args:
+            chart: Chart to receive the series and categories
+            ws: Worksheet holding the staged data
+            header_row: Row number of the series titles
+            category_col: Column number of the category values
+            count: Number of staged value rows
+            series_count: Number of series columns to the right of the categories
+        """
+        last_row = header_row + count
+        data = Reference(ws, min_col=category_col + 1, max_col=category_col + series_count,
+                         min_row=header_row, max_row=last_row)
+        chart.add_data(data, titles_from_data=True)
+        chart.set_categories(Reference(ws, min_col=category_col, min_row=header_row + 1, max_row=last_row))
+
+    def _new_chart(self, chart_class, title: str, y_title: str, x_title: Optional[str] = None,
+                   width: float = 12, height: float = 8):
+        """
+        Create a chart with the report style, titles and size applied.
+
+        Args:
+            chart_class: openpyxl chart class (BarChart, LineChart, ScatterChart, AreaChart)
+            title: Chart title
+            y_title: Value axis title
+            x_title: Category axis title, if any
+            width: Chart width in cm
+            height: Chart height in cm
+
+        Returns:
+            The new chart, ready for data
+        """
+        chart = chart_class()
+        chart.title = title
+        chart.style = self.CHART_STYLE
+        chart.y_axis.title = y_title
+        if x_title is not None:
+            chart.x_axis.title = x_title
+        chart.width = width
+        chart.height = height
+        return chart
+
+    def _auto_width_columns(self, ws) -> None:
+        """Auto-adjust column widths based on content."""
+        # Columns hold uniform content, so the first AUTO_WIDTH_SAMPLE_ROWS
+        # rows size them as well as a full scan; only columns with nothing
+        # in the sample (chart data placed below long tables) fall back to
+        # the rows below it. One pass over the written cells collects both,
+        # rather than iter_cols(), which creates a cell for every empty
+        # coordinate in the grid it walks.
+        sample_lengths: Dict[int, int] = {}
+        rest_lengths: Dict[int, int] = {}
+        for (row, col), cell in ws._cells.items():
+            value = cell.value
+            if value:
+                lengths = sample_lengths if row <= self.AUTO_WIDTH_SAMPLE_ROWS else rest_lengths
+                length = len(str(value))
+                if length > lengths.get(col, 0):
+                    lengths[col] = length
+
+        for col_idx in range(1, ws.max_column + 1):
+            max_length = sample_lengths.get(col_idx) or rest_lengths.get(col_idx, 0)
             adjusted_width = min(max_length + 2, 50)
-            ws.column_dimensions[column_letter].width = adjusted_width
+            ws.column_dimensions[get_column_letter(col_idx)].width = adjusted_width
 
     # ==========================================================================
     # SHEET 1: DASHBOARD (Executive Summary)
@@ -452,14 +817,14 @@ class KafkaPerformanceReporter:
         ws['A1'] = 'Kafka Performance Testing Report'
         ws['A1'].font = self.TITLE_FONT
         ws['A1'].fill = self.HEADER_FILL
-        ws['A1'].font = Font(bold=True, size=18, color="FFFFFF")
+        ws['A1'].font = self.DASHBOARD_TITLE_FONT
         ws.merge_cells('A1:L1')
         ws.row_dimensions[1].height = 30
 
         # Metadata row
         test_count = len(self.producer_results) + len(self.consumer_results)
         ws['A2'] = f'Generated: {datetime.now().strftime("%Y-%m-%d %H:%M:%S")} | Tests: {test_count} | Producer: {len(self.producer_results)} | Consumer: {len(self.consumer_results)}'
-        ws['A2'].font = Font(italic=True, size=10, color="666666")
+        ws['A2'].font = self.DASHBOARD_NOTE_FONT
         ws.merge_cells('A2:L2')
 
         # =======================================================================
@@ -468,20 +833,20 @@ class KafkaPerformanceReporter:
         self._create_dashboard_kpi_boxes(ws)
 
         # =======================================================================
-        # CHARTS SECTION
+        # CHARTS SECTION (all four are built from producer results)
         # =======================================================================
+        if self.has_producer:
+            # Chart 1: Top 10 Configurations (A12:G28)
+            self._add_top_configs_chart(ws, 'A12')
 
-        # Chart 1: Top 10 Configurations (A12:G28)
-        self._add_top_configs_chart(ws, 'A12')
-
-        # Chart 2: Latency vs Throughput Scatter - KNEE CHART PREVIEW (H12:N28)
-        self._add_knee_chart_preview(ws, 'H12')
+            # Chart 2: Latency vs Throughput Scatter - KNEE CHART PREVIEW (H12:N28)
+            self._add_knee_chart_preview(ws, 'H12')
 
-        # Chart 3: Scaling Degradation (A30:G46)
-        self._add_scaling_summary_chart(ws, 'A30')
+            # Chart 3: Scaling Degradation (A30:G46)
+            self._add_scaling_summary_chart(ws, 'A30')
 
-        # Chart 4: Acks Performance Summary (H30:N46)
-        self._add_acks_summary_chart(ws, 'H30')
+            # Chart 4: Acks Performance Summary (H30:N46)
+            self._add_acks_summary_chart(ws, 'H30')
 
         # Set column widths
         for col in range(1, 15):
@@ -491,34 +856,30 @@ class KafkaPerformanceReporter:
         """Create KPI summary boxes on dashboard."""
         row = 4
 
-        # Box styling
-        kpi_header_fill = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
-        kpi_header_font = Font(bold=True, size=11, color="FFFFFF")
-
         # =======================================================================
         # KPI BOX 1: MAX THROUGHPUT (A4:C9)
         # =======================================================================
         ws['A4'] = 'MAX THROUGHPUT'
-        ws['A4'].fill = kpi_header_fill
-        ws['A4'].font = kpi_header_font
+        ws['A4'].fill = self.KPI_HEADER_FILL
+        ws['A4'].font = self.KPI_HEADER_FONT
         ws.merge_cells('A4:C4')
 
         if self.stats.get('producer', {}).get('max_throughput_mb'):
             max_mb = self.stats['producer']['max_throughput_mb']
             ws['A5'] = f"{max_mb:.1f} MB/sec"
-            ws['A5'].font = Font(bold=True, size=20, color="00B050")
+            ws['A5'].font = self.KPI_VALUE_GREEN
             ws.merge_cells('A5:C5')
 
             max_rps = self.stats['producer'].get('max_throughput_rps', 0)
             ws['A6'] = f"{max_rps:,.0f} records/sec"
-            ws['A6'].font = Font(size=11)
+            ws['A6'].font = self.KPI_LABEL_FONT
             ws.merge_cells('A6:C6')
 
             # Best config for throughput
-            if self.scores.get('best_throughput_idx') is not None:
-                best = self.producer_df.loc[self.scores['best_throughput_idx']]
+            if self.scores.get('best_throughput_row') is not None:
+                best = self.scores['best_throughput_row']
                 ws['A7'] = f"acks={best['acks']}, batch={best['batch_size']}"
-                ws['A7'].font = Font(size=9, color="666666")
+                ws['A7'].font = self.KPI_VALUE_META
                 ws.merge_cells('A7:C7')
         else:
             ws['A5'] = 'No data'
@@ -528,24 +889,24 @@ class KafkaPerformanceReporter:
         # KPI BOX 2: MIN LATENCY (D4:F9)
         # =======================================================================
         ws['D4'] = 'MIN LATENCY'
-        ws['D4'].fill = kpi_header_fill
-        ws['D4'].font = kpi_header_font
+        ws['D4'].fill = self.KPI_HEADER_FILL
+        ws['D4'].font = self.KPI_HEADER_FONT
         ws.merge_cells('D4:F4')
 
         if self.stats.get('producer', {}).get('min_latency_ms'):
             min_lat = self.stats['producer']['min_latency_ms']
             ws['D5'] = f"{min_lat:.0f} ms"
-            ws['D5'].font = Font(bold=True, size=20, color="FF6B6B")
+            ws['D5'].font = self.KPI_VALUE_RED
             ws.merge_cells('D5:F5')
 
             # Best config for latency
-            if self.scores.get('best_latency_idx') is not None:
-                best = self.producer_df.loc[self.scores['best_latency_idx']]
+            if self.scores.get('best_latency_row') is not None:
+                best = self.scores['best_latency_row']
                 ws['D6'] = f"acks={best['acks']}"
-                ws['D6'].font = Font(size=11)
+                ws['D6'].font = self.KPI_LABEL_FONT
                 ws.merge_cells('D6:F6')
                 ws['D7'] = f"batch={best['batch_size']}"
-                ws['D7'].font = Font(size=9, color="666666")
+                ws['D7'].font = self.KPI_VALUE_META
                 ws.merge_cells('D7:F7')
         else:
             ws['D5'] = 'No data'
@@ -555,20 +916,20 @@ class KafkaPerformanceReporter:
         # KPI BOX 3: BALANCED CONFIG (G4:I9)
         # =======================================================================
         ws['G4'] = 'BALANCED CONFIG'
-        ws['G4'].fill = kpi_header_fill
-        ws['G4'].font = kpi_header_font
+        ws['G4'].fill = self.KPI_HEADER_FILL
+        ws['G4'].font = self.KPI_HEADER_FONT
         ws.merge_cells('G4:I4')
 
-        if self.scores.get('best_balanced_idx') is not None:
-            best = self.scores['scored_df'].loc[self.scores['best_balanced_idx']]
+        if self.scores.get('best_balanced_row') is not None:
+            best = self.scores['best_balanced_row']
             ws['G5'] = f"{best['throughput_mb']:.1f} MB/sec"
-            ws['G5'].font = Font(bold=True, size=14, color="4472C4")
+            ws['G5'].font = self.KPI_VALUE_BLUE
             ws.merge_cells('G5:I5')
             ws['G6'] = f"{best['avg_latency_ms']:.0f} ms latency"
-            ws['G6'].font = Font(size=11)
+            ws['G6'].font = self.KPI_LABEL_FONT
             ws.merge_cells('G6:I6')
             ws['G7'] = f"Score: {best['score_balanced']:.0f}/100"
-            ws['G7'].font = Font(size=9, color="666666")
+            ws['G7'].font = self.KPI_VALUE_META
             ws.merge_cells('G7:I7')
         else:
             ws['G5'] = 'No data'
@@ -578,21 +939,21 @@ class KafkaPerformanceReporter:
         # KPI BOX 4: SCALING IMPACT (J4:L9)
         # =======================================================================
         ws['J4'] = 'SCALING IMPACT'
-        ws['J4'].fill = kpi_header_fill
-        ws['J4'].font = kpi_header_font
+        ws['J4'].fill = self.KPI_HEADER_FILL
+        ws['J4'].font = self.KPI_HEADER_FONT
         ws.merge_cells('J4:L4')
 
         # Calculate scaling degradation
         scaling_info = self._calculate_scaling_degradation()
         if scaling_info:
             ws['J5'] = f"{scaling_info['degradation_pct']:.1f}% drop"
-            ws['J5'].font = Font(bold=True, size=14, color="FF6B6B" if scaling_info['degradation_pct'] > 30 else "FFD93D")
+            ws['J5'].font = self.KPI_SCALING_BAD if scaling_info['degradation_pct'] > 30 else self.KPI_SCALING_WARN
             ws.merge_cells('J5:L5')
             ws['J6'] = f"1 prod: {scaling_info['single_throughput']:.1f} MB/s"
-            ws['J6'].font = Font(size=10)
+            ws['J6'].font = self.KPI_DETAIL_FONT
             ws.merge_cells('J6:L6')
             ws['J7'] = f"{scaling_info['multi_count']} prod: {scaling_info['multi_throughput']:.1f} MB/s"
-            ws['J7'].font = Font(size=10, color="666666")
+            ws['J7'].font = self.KPI_DETAIL_META
             ws.merge_cells('J7:L7')
         else:
             ws['J5'] = 'N/A'
@@ -603,8 +964,7 @@ class KafkaPerformanceReporter:
         if self.producer_df.empty or 'num_producers' not in self.producer_df.columns:
             return None
 
-        df = self.producer_df
-        grouped = df.groupby('num_producers')['throughput_mb'].mean()
+        grouped = self._producer_scaling_df.set_index('num_producers')['throughput_mb']
 
         if len(grouped) < 2:
             return None
@@ -632,35 +992,21 @@ class KafkaPerformanceReporter:
             return
 
         # Get top 10 by throughput
-        top_10 = self.producer_df.nlargest(min(10, len(self.producer_df)), 'throughput_mb')
+        top_10 = self._top_n(self.producer_df, 10, 'throughput_mb')
 
         # Write data to hidden area (columns P-Q)
         data_start_row = 4
-        ws['P3'] = 'Config'
-        ws['Q3'] = 'Throughput (MB/sec)'
 
-        for idx, (_, row) in enumerate(top_10.iterrows()):
-            data_row = data_start_row + idx
-            config_label = f"a={row['acks']}_b={row['batch_size']}"
-            ws[f'P{data_row}'] = config_label
-            ws[f'Q{data_row}'] = row['throughput_mb']
+        top_rows = top_10[['acks', 'batch_size', 'throughput_mb']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, 3, 16, ['Config', 'Throughput (MB/sec)'], (
+            (f"a={acks}_b={batch_size}", throughput) for acks, batch_size, throughput in top_rows
+        ))
 
         # Create chart
-        chart = BarChart()
-        chart.type = "col"
-        chart.title = "Top Configurations by Throughput"
-        chart.style = self.CHART_STYLE
-        chart.y_axis.title = "MB/sec"
-        chart.x_axis.title = "Configuration"
-
-        data = Reference(ws, min_col=17, min_row=3, max_row=data_start_row + len(top_10) - 1)
-        categories = Reference(ws, min_col=16, min_row=4, max_row=data_start_row + len(top_10) - 1)
+        chart = self._new_chart(BarChart, "Top Configurations by Throughput", "MB/sec",
+                                x_title="Configuration", width=14, height=10)
 
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
-
-        chart.width = 14
-        chart.height = 10
+        self._plot_staged_data(chart, ws, data_start_row - 1, 16, len(top_10))
 
         ws.add_chart(chart, position)
 
@@ -670,20 +1016,12 @@ class KafkaPerformanceReporter:
             return
 
         # Write data to hidden area (columns R-S)
-        ws['R3'] = 'Throughput'
-        ws['S3'] = 'Latency'
-
-        for idx, (_, row) in enumerate(self.producer_df.iterrows()):
-            data_row = 4 + idx
-            ws[f'R{data_row}'] = row['throughput_mb']
-            ws[f'S{data_row}'] = row['avg_latency_ms']
+        points = self.producer_df[['throughput_mb', 'avg_latency_ms']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, 3, 18, ['Throughput', 'Latency'], points)
 
         # Create scatter chart
-        chart = ScatterChart()
-        chart.title = "Latency vs Throughput (Saturation Curve)"
-        chart.style = self.CHART_STYLE
-        chart.x_axis.title = "Throughput (MB/sec)"
-        chart.y_axis.title = "Avg Latency (ms)"
+        chart = self._new_chart(ScatterChart, "Latency vs Throughput (Saturation Curve)", "Avg Latency (ms)",
+                                x_title="Throughput (MB/sec)", width=14, height=10)
 
         xvalues = Reference(ws, min_col=18, min_row=3, max_row=3 + len(self.producer_df))
         yvalues = Reference(ws, min_col=19, min_row=3, max_row=3 + len(self.producer_df))
@@ -697,9 +1035,6 @@ class KafkaPerformanceReporter:
             # Add trendline
             chart.series[0].trendline = Trendline(trendlineType='poly', order=2)
 
-        chart.width = 14
-        chart.height = 10
-
         ws.add_chart(chart, position)
 
     def _add_scaling_summary_chart(self, ws, position: str) -> None:
@@ -707,41 +1042,20 @@ class KafkaPerformanceReporter:
         if self.producer_df.empty or 'num_producers' not in self.producer_df.columns:
             return
 
-        # Group by num_producers
-        scaling = self.producer_df.groupby('num_producers').agg({
-            'throughput_mb': 'mean',
-            'avg_latency_ms': 'mean'
-        }).reset_index()
+        scaling = self._producer_scaling_df
 
         if len(scaling) < 2:
             return
 
         # Write data (columns T-V)
-        ws['T3'] = 'Producers'
-        ws['U3'] = 'Throughput'
-        ws['V3'] = 'Latency'
-
-        for idx, row in scaling.iterrows():
-            data_row = 4 + idx
-            ws[f'T{data_row}'] = row['num_producers']
-            ws[f'U{data_row}'] = row['throughput_mb']
-            ws[f'V{data_row}'] = row['avg_latency_ms']
+        scaling_rows = scaling[['num_producers', 'throughput_mb', 'avg_latency_ms']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, 3, 20, ['Producers', 'Throughput', 'Latency'], scaling_rows)
 
         # Create line chart
-        chart = LineChart()
-        chart.title = "Scaling Performance"
-        chart.style = self.CHART_STYLE
-        chart.y_axis.title = "Throughput (MB/sec)"
-        chart.x_axis.title = "Number of Producers"
+        chart = self._new_chart(LineChart, "Scaling Performance", "Throughput (MB/sec)",
+                                x_title="Number of Producers", width=14, height=10)
 
-        data = Reference(ws, min_col=21, min_row=3, max_row=3 + len(scaling))
-        categories = Reference(ws, min_col=20, min_row=4, max_row=3 + len(scaling))
-
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
-
-        chart.width = 14
-        chart.height = 10
+        self._plot_staged_data(chart, ws, 3, 20, len(scaling))
 
         ws.add_chart(chart, position)
 
@@ -750,41 +1064,21 @@ class KafkaPerformanceReporter:
         if self.producer_df.empty:
             return
 
-        # Group by acks
-        acks_data = self.producer_df.groupby('acks').agg({
-            'throughput_mb': 'mean',
-            'avg_latency_ms': 'mean'
-        }).reset_index()
+        acks_data = self._producer_acks_df
 
         if acks_data.empty:
             return
 
         # Write data (columns W-Y)
-        ws['W3'] = 'acks'
-        ws['X3'] = 'Throughput'
-        ws['Y3'] = 'Latency'
-
-        for idx, row in acks_data.iterrows():
-            data_row = 4 + idx
-            ws[f'W{data_row}'] = str(row['acks'])
-            ws[f'X{data_row}'] = row['throughput_mb']
-            ws[f'Y{data_row}'] = row['avg_latency_ms']
+        acks_rows = acks_data[['acks', 'throughput_mb', 'avg_latency_ms']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, 3, 23, ['acks', 'Throughput', 'Latency'], (
+            (str(acks), throughput, latency) for acks, throughput, latency in acks_rows
+        ))
 
         # Create bar chart
-        chart = BarChart()
-        chart.type = "col"
-        chart.title = "Performance by acks Setting"
-        chart.style = self.CHART_STYLE
-        chart.y_axis.title = "MB/sec"
+        chart = self._new_chart(BarChart, "Performance by acks Setting", "MB/sec", width=14, height=10)
 
-        data = Reference(ws, min_col=24, min_row=3, max_row=3 + len(acks_data))
-        categories = Reference(ws, min_col=23, min_row=4, max_row=3 + len(acks_data))
-
-        chart.add_data(data, titles_from_data=True)
-        chart.set_categories(categories)
-
-        chart.width = 14
-        chart.height = 10
+        self._plot_staged_data(chart, ws, 3, 23, len(acks_data))
 
         ws.add_chart(chart, position)
 
@@ -805,51 +1099,46 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Throughput Analysis')
         self.log("Creating Throughput Analysis sheet...")
 
-        if self.producer_df.empty:
-            ws['A1'] = 'No producer test results available'
+        if not self.has_producer:
+            ws.cell(row=1, column=1, value='No producer test results available')
             return
 
         # Title
-        ws['A1'] = 'THROUGHPUT OPTIMIZATION ANALYSIS'
-        ws['A1'].font = self.TITLE_FONT
+        cell = ws.cell(row=1, column=1, value='THROUGHPUT OPTIMIZATION ANALYSIS')
+        cell.font = self.TITLE_FONT
         ws.merge_cells('A1:H1')
 
-        ws['A2'] = 'Deep dive into throughput metrics across all test configurations'
-        ws['A2'].font = Font(italic=True, color="666666")
+        cell = ws.cell(row=2, column=1, value='Deep dive into throughput metrics across all test configurations')
+        cell.font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         # =======================================================================
         # DATA TABLE: All producer results
         # =======================================================================
         row = 4
-        ws[f'A{row}'] = 'All Producer Test Results'
-        ws[f'A{row}'].font = self.SECTION_FONT
+        cell = ws.cell(row=row, column=1, value='All Producer Test Results')
+        cell.font = self.SECTION_FONT
         row += 1
 
         # Write headers
         headers = ['Scenario', 'acks', 'batch_size', 'linger_ms', 'compression',
                    'record_size', 'throughput_rps', 'throughput_mb', 'avg_latency_ms']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = self.HEADER_FILL
-            cell.font = self.HEADER_FONT
-            cell.border = self.BORDER
+        self._write_header_row(ws, row, headers)
         row += 1
 
         data_start_row = row
-        for _, df_row in self.producer_df.iterrows():
-            ws.cell(row=row, column=1, value=df_row['scenario'][:30])  # Truncate long names
-            ws.cell(row=row, column=2, value=df_row['acks'])
-            ws.cell(row=row, column=3, value=df_row['batch_size'])
-            ws.cell(row=row, column=4, value=df_row['linger_ms'])
-            ws.cell(row=row, column=5, value=df_row['compression_type'])
-            ws.cell(row=row, column=6, value=df_row['record_size'])
-            ws.cell(row=row, column=7, value=round(df_row['throughput_rps'], 2))
-            ws.cell(row=row, column=8, value=round(df_row['throughput_mb'], 2))
-            ws.cell(row=row, column=9, value=round(df_row['avg_latency_ms'], 2))
-            for col in range(1, 10):
-                ws.cell(row=row, column=col).border = self.BORDER
-            row += 1
+        table = self.producer_df[[
+            'scenario', 'acks', 'batch_size', 'linger_ms', 'compression_type',
+            'record_size', 'throughput_rps', 'throughput_mb', 'avg_latency_ms',
+        ]]
+        # Truncate long names
+        table_rows = table.assign(scenario=table['scenario'].str.slice(0, 30)).itertuples(index=False, name=None)
+        row = self._write_table_rows(ws, row, (
+            (scenario, acks, batch_size, linger_ms, compression_type, record_size,
+             round(throughput_rps, 2), round(throughput_mb, 2), round(avg_latency_ms, 2))
+            for (scenario, acks, batch_size, linger_ms, compression_type,
+                 record_size, throughput_rps, throughput_mb, avg_latency_ms) in table_rows
+        ))
 
         data_end_row = row - 1
         chart_start_row = row + 2
@@ -857,64 +1146,36 @@ class KafkaPerformanceReporter:
         # =======================================================================
         # CHART 1: Throughput by acks Setting (Clustered Bar)
         # =======================================================================
-        acks_grouped = self.producer_df.groupby('acks')['throughput_mb'].mean().reset_index()
-        acks_grouped = acks_grouped.sort_values('throughput_mb', ascending=False)
+        acks_grouped = self._producer_acks_df
 
         # Write chart data
-        ws[f'K{chart_start_row}'] = 'acks'
-        ws[f'L{chart_start_row}'] = 'Avg Throughput'
-        for idx, r in acks_grouped.iterrows():
-            ws[f'K{chart_start_row + 1 + idx}'] = str(r['acks'])
-            ws[f'L{chart_start_row + 1 + idx}'] = r['throughput_mb']
-
-        chart1 = BarChart()
-        chart1.type = "col"
-        chart1.title = "Throughput by acks Setting"
-        chart1.style = self.CHART_STYLE
-        chart1.y_axis.title = "MB/sec"
-        chart1.x_axis.title = "acks value"
-
-        data = Reference(ws, min_col=12, min_row=chart_start_row,
-                        max_row=chart_start_row + len(acks_grouped))
-        categories = Reference(ws, min_col=11, min_row=chart_start_row + 1,
-                              max_row=chart_start_row + len(acks_grouped))
-        chart1.add_data(data, titles_from_data=True)
-        chart1.set_categories(categories)
-        chart1.width = 12
-        chart1.height = 8
+        chart_rows = acks_grouped[['acks', 'throughput_mb']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart_start_row, 11, ['acks', 'Avg Throughput'], (
+            (str(acks), throughput) for acks, throughput in chart_rows
+        ))
+
+        chart1 = self._new_chart(BarChart, "Throughput by acks Setting", "MB/sec", x_title="acks value")
+
+        self._plot_staged_data(chart1, ws, chart_start_row, 11, len(acks_grouped))
 
         ws.add_chart(chart1, f'A{chart_start_row}')
 
         # =======================================================================
         # CHART 2: Throughput by Batch Size (Line Chart)
         # =======================================================================
-        batch_grouped = self.producer_df.groupby('batch_size')['throughput_mb'].mean().reset_index()
-        batch_grouped = batch_grouped.sort_values('batch_size')
+        batch_grouped = self._producer_batch_df
 
         # Write chart data
         batch_data_col = 14
-        ws.cell(row=chart_start_row, column=batch_data_col, value='batch_size')
-        ws.cell(row=chart_start_row, column=batch_data_col + 1, value='Throughput')
 
-        for idx, r in batch_grouped.iterrows():
-            ws.cell(row=chart_start_row + 1 + idx, column=batch_data_col, value=r['batch_size'])
-            ws.cell(row=chart_start_row + 1 + idx, column=batch_data_col + 1, value=r['throughput_mb'])
+        chart_rows = batch_grouped[['batch_size', 'throughput_mb']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart_start_row, batch_data_col, ['batch_size', 'Throughput'], chart_rows)
 
         if len(batch_grouped) > 1:
-            chart2 = LineChart()
-            chart2.title = "Throughput by Batch Size"
-            chart2.style = self.CHART_STYLE
-            chart2.y_axis.title = "MB/sec"
-            chart2.x_axis.title = "batch.size (bytes)"
-
-            data = Reference(ws, min_col=batch_data_col + 1, min_row=chart_start_row,
-                            max_row=chart_start_row + len(batch_grouped))
-            categories = Reference(ws, min_col=batch_data_col, min_row=chart_start_row + 1,
-                                  max_row=chart_start_row + len(batch_grouped))
-            chart2.add_data(data, titles_from_data=True)
-            chart2.set_categories(categories)
-            chart2.width = 12
-            chart2.height = 8
+            chart2 = self._new_chart(LineChart, "Throughput by Batch Size", "MB/sec",
+                                     x_title="batch.size (bytes)")
+
+            self._plot_staged_data(chart2, ws, chart_start_row, batch_data_col, len(batch_grouped))
 
             ws.add_chart(chart2, f'G{chart_start_row}')
 
@@ -924,18 +1185,11 @@ class KafkaPerformanceReporter:
         chart3_row = chart_start_row + 18
 
         # Write chart data
-        ws.cell(row=chart3_row, column=11, value='Records/sec')
-        ws.cell(row=chart3_row, column=12, value='MB/sec')
+        points = self.producer_df[['throughput_rps', 'throughput_mb']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart3_row, 11, ['Records/sec', 'MB/sec'], points)
 
-        for idx, (_, r) in enumerate(self.producer_df.iterrows()):
-            ws.cell(row=chart3_row + 1 + idx, column=11, value=r['throughput_rps'])
-            ws.cell(row=chart3_row + 1 + idx, column=12, value=r['throughput_mb'])
-
-        chart3 = ScatterChart()
-        chart3.title = "Records/Sec vs MB/Sec Correlation"
-        chart3.style = self.CHART_STYLE
-        chart3.x_axis.title = "Records/sec"
-        chart3.y_axis.title = "MB/sec"
+        chart3 = self._new_chart(ScatterChart, "Records/Sec vs MB/Sec Correlation", "MB/sec",
+                                 x_title="Records/sec")
 
         xvalues = Reference(ws, min_col=11, min_row=chart3_row,
                            max_row=chart3_row + len(self.producer_df))
@@ -946,39 +1200,22 @@ class KafkaPerformanceReporter:
         if chart3.series:
             chart3.series[0].marker = Marker(symbol='circle', size=7)
             chart3.series[0].graphicalProperties.line.noFill = True
-        chart3.width = 12
-        chart3.height = 8
 
         ws.add_chart(chart3, f'A{chart3_row}')
 
         # =======================================================================
         # CHART 4: Compression Efficiency
         # =======================================================================
-        compression_grouped = self.producer_df.groupby('compression_type')['throughput_mb'].mean().reset_index()
+        compression_grouped = self._producer_compression_df
 
         # Write chart data
-        ws.cell(row=chart3_row, column=14, value='Compression')
-        ws.cell(row=chart3_row, column=15, value='Throughput')
-
-        for idx, r in compression_grouped.iterrows():
-            ws.cell(row=chart3_row + 1 + idx, column=14, value=r['compression_type'])
-            ws.cell(row=chart3_row + 1 + idx, column=15, value=r['throughput_mb'])
+        compression_rows = compression_grouped[['compression_type', 'throughput_mb']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart3_row, 14, ['Compression', 'Throughput'], compression_rows)
 
         if len(compression_grouped) > 1:
-            chart4 = BarChart()
-            chart4.type = "col"
-            chart4.title = "Compression Type Impact"
-            chart4.style = self.CHART_STYLE
-            chart4.y_axis.title = "MB/sec"
-
-            data = Reference(ws, min_col=15, min_row=chart3_row,
-                            max_row=chart3_row + len(compression_grouped))
-            categories = Reference(ws, min_col=14, min_row=chart3_row + 1,
-                                  max_row=chart3_row + len(compression_grouped))
-            chart4.add_data(data, titles_from_data=True)
-            chart4.set_categories(categories)
-            chart4.width = 12
-            chart4.height = 8
+            chart4 = self._new_chart(BarChart, "Compression Type Impact", "MB/sec")
+
+            self._plot_staged_data(chart4, ws, chart3_row, 14, len(compression_grouped))
 
             ws.add_chart(chart4, f'G{chart3_row}')
 
@@ -1001,7 +1238,7 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Latency Analysis')
         self.log("Creating Latency Analysis sheet...")
 
-        if self.producer_df.empty:
+        if not self.has_producer:
             ws['A1'] = 'No producer test results available'
             return
 
@@ -1011,7 +1248,7 @@ class KafkaPerformanceReporter:
         ws.merge_cells('A1:H1')
 
         ws['A2'] = 'Percentile distributions and latency trends'
-        ws['A2'].font = Font(italic=True, color="666666")
+        ws['A2'].font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         # =======================================================================
@@ -1023,27 +1260,18 @@ class KafkaPerformanceReporter:
         row += 1
 
         headers = ['Config', 'acks', 'batch_size', 'avg_ms', 'p50_ms', 'p95_ms', 'p99_ms', 'p999_ms', 'max_ms']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = self.HEADER_FILL
-            cell.font = self.HEADER_FONT
-            cell.border = self.BORDER
+        self._write_header_row(ws, row, headers)
         row += 1
 
-        for _, df_row in self.producer_df.iterrows():
-            config_label = f"a={df_row['acks']}_b={df_row['batch_size']}"
-            ws.cell(row=row, column=1, value=config_label)
-            ws.cell(row=row, column=2, value=df_row['acks'])
-            ws.cell(row=row, column=3, value=df_row['batch_size'])
-            ws.cell(row=row, column=4, value=round(df_row['avg_latency_ms'], 1))
-            ws.cell(row=row, column=5, value=df_row['p50_ms'])
-            ws.cell(row=row, column=6, value=df_row['p95_ms'])
-            ws.cell(row=row, column=7, value=df_row['p99_ms'])
-            ws.cell(row=row, column=8, value=df_row['p999_ms'])
-            ws.cell(row=row, column=9, value=round(df_row['max_latency_ms'], 1))
-            for col in range(1, 10):
-                ws.cell(row=row, column=col).border = self.BORDER
-            row += 1
+        table_rows = self.producer_df[[
+            'acks', 'batch_size', 'avg_latency_ms', 'p50_ms', 'p95_ms',
+            'p99_ms', 'p999_ms', 'max_latency_ms',
+        ]].itertuples(index=False, name=None)
+        row = self._write_table_rows(ws, row, (
+            (f"a={acks}_b={batch_size}", acks, batch_size, round(avg_latency, 1),
+             p50, p95, p99, p999, round(max_latency, 1))
+            for acks, batch_size, avg_latency, p50, p95, p99, p999, max_latency in table_rows
+        ))
 
         chart_start_row = row + 2
 
@@ -1053,69 +1281,35 @@ class KafkaPerformanceReporter:
         # Get best (lowest latency) and worst (highest latency) configs
         best_idx = self.producer_df['avg_latency_ms'].idxmin()
         worst_idx = self.producer_df['avg_latency_ms'].idxmax()
-        best = self.producer_df.loc[best_idx]
-        worst = self.producer_df.loc[worst_idx]
+        percentile_columns = ['p50_ms', 'p95_ms', 'p99_ms', 'p999_ms']
+        best = self.producer_df.loc[best_idx, percentile_columns].tolist()
+        worst = self.producer_df.loc[worst_idx, percentile_columns].tolist()
 
         # Write percentile data
         percentiles = ['p50', 'p95', 'p99', 'p999']
-        ws.cell(row=chart_start_row, column=11, value='Percentile')
-        ws.cell(row=chart_start_row, column=12, value='Best Config')
-        ws.cell(row=chart_start_row, column=13, value='Worst Config')
-
-        for idx, pct in enumerate(percentiles):
-            ws.cell(row=chart_start_row + 1 + idx, column=11, value=pct)
-            ws.cell(row=chart_start_row + 1 + idx, column=12, value=best[f'{pct}_ms'])
-            ws.cell(row=chart_start_row + 1 + idx, column=13, value=worst[f'{pct}_ms'])
-
-        chart1 = BarChart()
-        chart1.type = "col"
-        chart1.title = "Latency Percentile Distribution"
-        chart1.style = self.CHART_STYLE
-        chart1.y_axis.title = "Latency (ms)"
-        chart1.x_axis.title = "Percentile"
-
-        data = Reference(ws, min_col=12, max_col=13, min_row=chart_start_row,
-                        max_row=chart_start_row + len(percentiles))
-        categories = Reference(ws, min_col=11, min_row=chart_start_row + 1,
-                              max_row=chart_start_row + len(percentiles))
-        chart1.add_data(data, titles_from_data=True)
-        chart1.set_categories(categories)
-        chart1.width = 12
-        chart1.height = 8
+        chart_headers = ['Percentile', 'Best Config', 'Worst Config']
+        self._write_chart_data(ws, chart_start_row, 11, chart_headers, zip(percentiles, best, worst))
+
+        chart1 = self._new_chart(BarChart, "Latency Percentile Distribution", "Latency (ms)",
+                                 x_title="Percentile")
+
+        self._plot_staged_data(chart1, ws, chart_start_row, 11, len(percentiles), series_count=2)
 
         ws.add_chart(chart1, f'A{chart_start_row}')
 
         # =======================================================================
         # CHART 2: Latency by acks Setting
         # =======================================================================
-        acks_latency = self.producer_df.groupby('acks').agg({
-            'avg_latency_ms': 'mean',
-            'p99_ms': 'mean'
-        }).reset_index()
-
-        ws.cell(row=chart_start_row, column=15, value='acks')
-        ws.cell(row=chart_start_row, column=16, value='Avg Latency')
-        ws.cell(row=chart_start_row, column=17, value='P99 Latency')
-
-        for idx, r in acks_latency.iterrows():
-            ws.cell(row=chart_start_row + 1 + idx, column=15, value=str(r['acks']))
-            ws.cell(row=chart_start_row + 1 + idx, column=16, value=round(r['avg_latency_ms'], 1))
-            ws.cell(row=chart_start_row + 1 + idx, column=17, value=round(r['p99_ms'], 1))
-
-        chart2 = BarChart()
-        chart2.type = "col"
-        chart2.title = "Latency by acks Setting"
-        chart2.style = self.CHART_STYLE
-        chart2.y_axis.title = "Latency (ms)"
-
-        data = Reference(ws, min_col=16, max_col=17, min_row=chart_start_row,
-                        max_row=chart_start_row + len(acks_latency))
-        categories = Reference(ws, min_col=15, min_row=chart_start_row + 1,
-                              max_row=chart_start_row + len(acks_latency))
-        chart2.add_data(data, titles_from_data=True)
-        chart2.set_categories(categories)
-        chart2.width = 12
-        chart2.height = 8
+        acks_latency = self._producer_acks_df
+
+        acks_rows = acks_latency[['acks', 'avg_latency_ms', 'p99_ms']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart_start_row, 15, ['acks', 'Avg Latency', 'P99 Latency'], (
+            (str(acks), round(avg_latency, 1), round(p99, 1)) for acks, avg_latency, p99 in acks_rows
+        ))
+
+        chart2 = self._new_chart(BarChart, "Latency by acks Setting", "Latency (ms)")
+
+        self._plot_staged_data(chart2, ws, chart_start_row, 15, len(acks_latency), series_count=2)
 
         ws.add_chart(chart2, f'G{chart_start_row}')
 
@@ -1124,49 +1318,25 @@ class KafkaPerformanceReporter:
         # =======================================================================
         chart3_row = chart_start_row + 18
 
-        ws.cell(row=chart3_row, column=11, value='Config')
-        ws.cell(row=chart3_row, column=12, value='Avg')
-        ws.cell(row=chart3_row, column=13, value='P95')
-        ws.cell(row=chart3_row, column=14, value='P99')
-
-        for idx, (_, r) in enumerate(self.producer_df.iterrows()):
-            config_label = f"a={r['acks']}"
-            ws.cell(row=chart3_row + 1 + idx, column=11, value=config_label)
-            ws.cell(row=chart3_row + 1 + idx, column=12, value=round(r['avg_latency_ms'], 1))
-            ws.cell(row=chart3_row + 1 + idx, column=13, value=r['p95_ms'])
-            ws.cell(row=chart3_row + 1 + idx, column=14, value=r['p99_ms'])
-
-        chart3 = LineChart()
-        chart3.title = "Latency Trend (Avg, P95, P99)"
-        chart3.style = self.CHART_STYLE
-        chart3.y_axis.title = "Latency (ms)"
-
-        data = Reference(ws, min_col=12, max_col=14, min_row=chart3_row,
-                        max_row=chart3_row + len(self.producer_df))
-        categories = Reference(ws, min_col=11, min_row=chart3_row + 1,
-                              max_row=chart3_row + len(self.producer_df))
-        chart3.add_data(data, titles_from_data=True)
-        chart3.set_categories(categories)
-        chart3.width = 12
-        chart3.height = 8
+        trend_rows = self.producer_df[['acks', 'avg_latency_ms', 'p95_ms', 'p99_ms']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart3_row, 11, ['Config', 'Avg', 'P95', 'P99'], (
+            (f"a={acks}", round(avg_latency, 1), p95, p99) for acks, avg_latency, p95, p99 in trend_rows
+        ))
+
+        chart3 = self._new_chart(LineChart, "Latency Trend (Avg, P95, P99)", "Latency (ms)")
+
+        self._plot_staged_data(chart3, ws, chart3_row, 11, len(self.producer_df), series_count=3)
 
         ws.add_chart(chart3, f'A{chart3_row}')
 
         # =======================================================================
         # CHART 4: Latency vs Batch Size (Scatter)
         # =======================================================================
-        ws.cell(row=chart3_row, column=16, value='Batch Size')
-        ws.cell(row=chart3_row, column=17, value='Avg Latency')
-
-        for idx, (_, r) in enumerate(self.producer_df.iterrows()):
-            ws.cell(row=chart3_row + 1 + idx, column=16, value=r['batch_size'])
-            ws.cell(row=chart3_row + 1 + idx, column=17, value=r['avg_latency_ms'])
+        points = self.producer_df[['batch_size', 'avg_latency_ms']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart3_row, 16, ['Batch Size', 'Avg Latency'], points)
 
-        chart4 = ScatterChart()
-        chart4.title = "Latency vs Batch Size"
-        chart4.style = self.CHART_STYLE
-        chart4.x_axis.title = "Batch Size (bytes)"
-        chart4.y_axis.title = "Avg Latency (ms)"
+        chart4 = self._new_chart(ScatterChart, "Latency vs Batch Size", "Avg Latency (ms)",
+                                 x_title="Batch Size (bytes)")
 
         xvalues = Reference(ws, min_col=16, min_row=chart3_row,
                            max_row=chart3_row + len(self.producer_df))
@@ -1177,8 +1347,6 @@ class KafkaPerformanceReporter:
         if chart4.series:
             chart4.series[0].marker = Marker(symbol='circle', size=7)
             chart4.series[0].graphicalProperties.line.noFill = True
-        chart4.width = 12
-        chart4.height = 8
 
         ws.add_chart(chart4, f'G{chart3_row}')
 
@@ -1201,84 +1369,70 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Trade-off Analysis')
         self.log("Creating Trade-off Analysis sheet (THE KNEE CHART)...")
 
-        if self.producer_df.empty:
-            ws['A1'] = 'No producer test results available'
+        if not self.has_producer:
+            ws.cell(row=1, column=1, value='No producer test results available')
             return
 
         # Title
-        ws['A1'] = 'TRADE-OFF ANALYSIS: The Saturation Curve'
-        ws['A1'].font = self.TITLE_FONT
+        cell = ws.cell(row=1, column=1, value='TRADE-OFF ANALYSIS: The Saturation Curve')
+        cell.font = self.TITLE_FONT
         ws.merge_cells('A1:L1')
 
-        ws['A2'] = 'THE CRITICAL CHART: Shows where system saturates (latency explodes)'
-        ws['A2'].font = Font(bold=True, italic=True, color="C00000")
+        cell = ws.cell(row=2, column=1, value='THE CRITICAL CHART: Shows where system saturates (latency explodes)')
+        cell.font = self.WARNING_FONT
         ws.merge_cells('A2:L2')
 
         # =======================================================================
         # ZONE LEGEND
         # =======================================================================
         row = 4
-        ws[f'A{row}'] = 'Performance Zones:'
-        ws[f'A{row}'].font = self.SECTION_FONT
+        cell = ws.cell(row=row, column=1, value='Performance Zones:')
+        cell.font = self.SECTION_FONT
 
-        ws[f'B{row}'] = 'Safe Zone (0-50 MB/s, <1000ms)'
-        ws[f'B{row}'].fill = PatternFill(start_color="C6EFCE", end_color="C6EFCE", fill_type="solid")
+        cell = ws.cell(row=row, column=2, value='Safe Zone (0-50 MB/s, <1000ms)')
+        cell.fill = self.GOOD_FILL
 
-        ws[f'D{row}'] = 'Diminishing Returns (50-90 MB/s)'
-        ws[f'D{row}'].fill = PatternFill(start_color="FFEB9C", end_color="FFEB9C", fill_type="solid")
+        cell = ws.cell(row=row, column=4, value='Diminishing Returns (50-90 MB/s)')
+        cell.fill = self.NEUTRAL_FILL
 
-        ws[f'F{row}'] = 'Saturation (>90 MB/s, high latency)'
-        ws[f'F{row}'].fill = PatternFill(start_color="FFC7CE", end_color="FFC7CE", fill_type="solid")
+        cell = ws.cell(row=row, column=6, value='Saturation (>90 MB/s, high latency)')
+        cell.fill = self.BAD_FILL
 
         # =======================================================================
         # DATA TABLE with performance zones
         # =======================================================================
         row = 6
-        ws[f'A{row}'] = 'Configuration Performance Data'
-        ws[f'A{row}'].font = self.SECTION_FONT
+        cell = ws.cell(row=row, column=1, value='Configuration Performance Data')
+        cell.font = self.SECTION_FONT
         row += 1
 
         headers = ['Config', 'acks', 'Throughput (MB/s)', 'Latency (ms)', 'P99 (ms)', 'Zone', 'Score']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = self.HEADER_FILL
-            cell.font = self.HEADER_FONT
-            cell.border = self.BORDER
+        self._write_header_row(ws, row, headers)
         row += 1
 
         scored_df = self.scores.get('scored_df', self.producer_df)
 
-        for _, r in scored_df.iterrows():
-            config_label = f"a={r['acks']}_b={r['batch_size']}"
-            throughput = r['throughput_mb']
-            latency = r['avg_latency_ms']
-
-            # Determine zone
-            if throughput < 50 and latency < 1000:
-                zone = 'Safe'
-                zone_fill = self.GOOD_FILL
-            elif throughput < 90:
-                zone = 'Diminishing'
-                zone_fill = self.NEUTRAL_FILL
-            else:
-                zone = 'Saturation'
-                zone_fill = self.BAD_FILL
-
-            ws.cell(row=row, column=1, value=config_label)
-            ws.cell(row=row, column=2, value=r['acks'])
-            ws.cell(row=row, column=3, value=round(throughput, 2))
-            ws.cell(row=row, column=4, value=round(latency, 1))
-            ws.cell(row=row, column=5, value=r['p99_ms'])
-            ws.cell(row=row, column=6, value=zone)
-            ws.cell(row=row, column=6).fill = zone_fill
-
-            # Score
-            score = r.get('score_balanced', 0)
-            ws.cell(row=row, column=7, value=round(score, 1))
-
-            for col in range(1, 8):
-                ws.cell(row=row, column=col).border = self.BORDER
-            row += 1
+        # Determine zones
+        zone_codes = _classify_zones(
+            scored_df['throughput_mb'].to_numpy(dtype=np.float64),
+            scored_df['avg_latency_ms'].to_numpy(dtype=np.float64),
+        )
+
+        table_rows = scored_df[[
+            'acks', 'batch_size', 'throughput_mb', 'avg_latency_ms', 'p99_ms', 'score_balanced',
+        ]].itertuples(index=False, name=None)
+        table_values = []
+        zone_fills = []
+        for (acks, batch_size, throughput, latency, p99, score), zone_code in zip(table_rows, zone_codes.tolist()):
+            config_label = f"a={acks}_b={batch_size}"
+            table_values.append((config_label, acks, round(throughput, 2), round(latency, 1),
+                                 p99, self.ZONE_LABELS[zone_code], round(score, 1)))
+            zone_fills.append(self.ZONE_FILLS[zone_code])
+
+        end_row = self._write_table_rows(ws, row, table_values)
+        for zone_row, zone_fill in enumerate(zone_fills, row):
+            ws.cell(row=zone_row, column=6).fill = zone_fill
+        row = end_row
 
         chart_start_row = row + 2
 
@@ -1286,21 +1440,12 @@ class KafkaPerformanceReporter:
         # THE KNEE CHART: Latency vs Throughput (MAIN VISUALIZATION)
         # =======================================================================
         # Write chart data with acks grouping
-        ws.cell(row=chart_start_row, column=10, value='Throughput')
-        ws.cell(row=chart_start_row, column=11, value='Latency')
-        ws.cell(row=chart_start_row, column=12, value='acks')
-
-        for idx, (_, r) in enumerate(self.producer_df.iterrows()):
-            ws.cell(row=chart_start_row + 1 + idx, column=10, value=r['throughput_mb'])
-            ws.cell(row=chart_start_row + 1 + idx, column=11, value=r['avg_latency_ms'])
-            ws.cell(row=chart_start_row + 1 + idx, column=12, value=r['acks'])
+        points = self.producer_df[['throughput_mb', 'avg_latency_ms', 'acks']].itertuples(index=False, name=None)
+        self._write_chart_data(ws, chart_start_row, 10, ['Throughput', 'Latency', 'acks'], points)
 
         # Create THE KNEE CHART
-        chart = ScatterChart()
-        chart.title = "THE KNEE CHART: Latency vs Throughput Saturation"
-        chart.style = self.CHART_STYLE
-        chart.x_axis.title = "Throughput (MB/sec)"
-        chart.y_axis.title = "Average Latency (ms)"
+        chart = self._new_chart(ScatterChart, "THE KNEE CHART: Latency vs Throughput Saturation", "Average Latency (ms)",
+                                x_title="Throughput (MB/sec)", width=16, height=12)
         chart.x_axis.scaling.min = 0
         chart.y_axis.scaling.min = 0
 
@@ -1319,9 +1464,6 @@ class KafkaPerformanceReporter:
             # Add polynomial trendline to show the "knee"
             chart.series[0].trendline = Trendline(trendlineType='poly', order=2, dispEq=False, dispRSqr=False)
 
-        chart.width = 16
-        chart.height = 12
-
         ws.add_chart(chart, f'A{chart_start_row}')
 
         # =======================================================================
@@ -1329,37 +1471,22 @@ class KafkaPerformanceReporter:
         # =======================================================================
         score_chart_row = chart_start_row + 26
 
-        ws[f'A{score_chart_row}'] = 'Performance Score Breakdown'
-        ws[f'A{score_chart_row}'].font = self.SECTION_FONT
+        cell = ws.cell(row=score_chart_row, column=1, value='Performance Score Breakdown')
+        cell.font = self.SECTION_FONT
 
         # Write score data
-        ws.cell(row=score_chart_row + 1, column=10, value='Config')
-        ws.cell(row=score_chart_row + 1, column=11, value='Throughput Score')
-        ws.cell(row=score_chart_row + 1, column=12, value='Latency Score')
-        ws.cell(row=score_chart_row + 1, column=13, value='Consistency Score')
-
-        top_5 = scored_df.nlargest(5, 'score_balanced')
-        for idx, (_, r) in enumerate(top_5.iterrows()):
-            config_label = f"a={r['acks']}"
-            ws.cell(row=score_chart_row + 2 + idx, column=10, value=config_label)
-            ws.cell(row=score_chart_row + 2 + idx, column=11, value=round(r['throughput_score'], 1))
-            ws.cell(row=score_chart_row + 2 + idx, column=12, value=round(r['latency_score'], 1))
-            ws.cell(row=score_chart_row + 2 + idx, column=13, value=round(r['consistency_score'], 1))
-
-        chart2 = BarChart()
-        chart2.type = "col"
-        chart2.title = "Top 5 Configurations - Score Breakdown"
-        chart2.style = self.CHART_STYLE
-        chart2.y_axis.title = "Score (0-100)"
-
-        data = Reference(ws, min_col=11, max_col=13, min_row=score_chart_row + 1,
-                        max_row=score_chart_row + 1 + len(top_5))
-        categories = Reference(ws, min_col=10, min_row=score_chart_row + 2,
-                              max_row=score_chart_row + 1 + len(top_5))
-        chart2.add_data(data, titles_from_data=True)
-        chart2.set_categories(categories)
-        chart2.width = 14
-        chart2.height = 8
+        top_5 = self._top_n(scored_df, 5, 'score_balanced')
+        top_rows = top_5[['acks', 'throughput_score', 'latency_score', 'consistency_score']].itertuples(index=False, name=None)
+        chart_headers = ['Config', 'Throughput Score', 'Latency Score', 'Consistency Score']
+        self._write_chart_data(ws, score_chart_row + 1, 10, chart_headers, (
+            (f"a={acks}", round(throughput_score, 1), round(latency_score, 1), round(consistency_score, 1))
+            for acks, throughput_score, latency_score, consistency_score in top_rows
+        ))
+
+        chart2 = self._new_chart(BarChart, "Top 5 Configurations - Score Breakdown", "Score (0-100)",
+                                 width=14, height=8)
+
+        self._plot_staged_data(chart2, ws, score_chart_row + 1, 10, len(top_5), series_count=3)
 
         ws.add_chart(chart2, f'A{score_chart_row + 2}')
 
@@ -1368,7 +1495,7 @@ class KafkaPerformanceReporter:
         # =======================================================================
         method_row = score_chart_row + 2
         ws.cell(row=method_row, column=1, value='Scoring Methodology:')
-        ws.cell(row=method_row, column=1).font = Font(bold=True)
+        ws.cell(row=method_row, column=1).font = self.BOLD_FONT
         ws.cell(row=method_row + 1, column=1, value='Throughput Score = (test_throughput / max_observed) * 100')
         ws.cell(row=method_row + 2, column=1, value='Latency Score = 100 - ((test_latency / max_observed) * 100)')
         ws.cell(row=method_row + 3, column=1, value='Consistency Score = Based on P99/Avg ratio')
@@ -1399,7 +1526,7 @@ class KafkaPerformanceReporter:
         ws.merge_cells('A1:H1')
 
         ws['A2'] = 'How performance degrades with multiple producers/consumers'
-        ws['A2'].font = Font(italic=True, color="666666")
+        ws['A2'].font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         # =======================================================================
@@ -1411,46 +1538,46 @@ class KafkaPerformanceReporter:
         row += 1
 
         # Group by num_producers
-        if not self.producer_df.empty and 'num_producers' in self.producer_df.columns:
-            scaling_data = self.producer_df.groupby('num_producers').agg({
-                'throughput_mb': ['mean', 'sum'],
-                'avg_latency_ms': 'mean'
-            }).reset_index()
-            scaling_data.columns = ['num_producers', 'avg_throughput', 'total_throughput', 'avg_latency']
+        if self.has_producer and 'num_producers' in self.producer_df.columns:
+            # Reuse the cached per-count means; only the totals need their own pass
+            means = self._producer_scaling_df
+            scaling_data = pd.DataFrame({
+                'num_producers': means['num_producers'],
+                'avg_throughput': means['throughput_mb'],
+                'total_throughput': self.producer_df.groupby('num_producers', sort=True)['throughput_mb'].sum().to_numpy(),
+                'avg_latency': means['avg_latency_ms'],
+            })
 
             # Calculate per-producer throughput and ideal scaling
             if len(scaling_data) > 0:
-                single_throughput = scaling_data[scaling_data['num_producers'] == 1]['avg_throughput'].values
-                if len(single_throughput) > 0:
-                    single_throughput = single_throughput[0]
-                else:
-                    single_throughput = scaling_data['avg_throughput'].iloc[0]
-
-                scaling_data['per_producer_throughput'] = scaling_data['total_throughput'] / scaling_data['num_producers']
-                scaling_data['ideal_throughput'] = single_throughput
-                scaling_data['efficiency_pct'] = (scaling_data['per_producer_throughput'] / single_throughput) * 100
+                num_producers = scaling_data['num_producers'].to_numpy()
+                avg_throughput = scaling_data['avg_throughput'].to_numpy()
+                single_throughput = avg_throughput[num_producers == 1]
+                single_throughput = single_throughput[0] if len(single_throughput) > 0 else avg_throughput[0]
+
+                per_producer = scaling_data['total_throughput'].to_numpy() / num_producers
+                scaling_data = scaling_data.assign(
+                    per_producer_throughput=per_producer,
+                    ideal_throughput=single_throughput,
+                    efficiency_pct=(per_producer / single_throughput) * 100,
+                )
 
             # Write data table
             headers = ['Num Producers', 'Avg Throughput', 'Total Throughput', 'Per-Producer', 'Ideal', 'Efficiency %', 'Avg Latency']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.fill = self.HEADER_FILL
-                cell.font = self.HEADER_FONT
-                cell.border = self.BORDER
+            self._write_header_row(ws, row, headers)
             row += 1
 
             data_start_row = row
-            for _, r in scaling_data.iterrows():
-                ws.cell(row=row, column=1, value=int(r['num_producers']))
-                ws.cell(row=row, column=2, value=round(r['avg_throughput'], 2))
-                ws.cell(row=row, column=3, value=round(r['total_throughput'], 2))
-                ws.cell(row=row, column=4, value=round(r['per_producer_throughput'], 2))
-                ws.cell(row=row, column=5, value=round(r['ideal_throughput'], 2))
-                ws.cell(row=row, column=6, value=round(r['efficiency_pct'], 1))
-                ws.cell(row=row, column=7, value=round(r['avg_latency'], 1))
-                for col in range(1, 8):
-                    ws.cell(row=row, column=col).border = self.BORDER
-                row += 1
+            table_rows = self._numeric_rows(scaling_data, [
+                'num_producers', 'avg_throughput', 'total_throughput', 'per_producer_throughput',
+                'ideal_throughput', 'efficiency_pct', 'avg_latency',
+            ])
+            row = self._write_table_rows(ws, row, (
+                (int(num_producers), round(avg_throughput, 2), round(total_throughput, 2),
+                 round(per_producer, 2), round(ideal, 2), round(efficiency_pct, 1), round(avg_latency, 1))
+                for (num_producers, avg_throughput, total_throughput, per_producer,
+                     ideal, efficiency_pct, avg_latency) in table_rows
+            ))
 
             chart_start_row = row + 2
 
@@ -1459,56 +1586,37 @@ class KafkaPerformanceReporter:
             # =======================================================================
             if len(scaling_data) > 1:
                 # Write chart data
-                ws.cell(row=chart_start_row, column=10, value='Producers')
-                ws.cell(row=chart_start_row, column=11, value='Actual Per-Producer')
-                ws.cell(row=chart_start_row, column=12, value='Ideal (Linear)')
-
-                for idx, r in scaling_data.iterrows():
-                    ws.cell(row=chart_start_row + 1 + idx, column=10, value=int(r['num_producers']))
-                    ws.cell(row=chart_start_row + 1 + idx, column=11, value=round(r['per_producer_throughput'], 2))
-                    ws.cell(row=chart_start_row + 1 + idx, column=12, value=round(r['ideal_throughput'], 2))
-
-                chart1 = LineChart()
-                chart1.title = "Throughput per Producer: Actual vs Ideal"
-                chart1.style = self.CHART_STYLE
-                chart1.y_axis.title = "MB/sec per Producer"
-                chart1.x_axis.title = "Number of Producers"
-
-                data = Reference(ws, min_col=11, max_col=12, min_row=chart_start_row,
-                                max_row=chart_start_row + len(scaling_data))
-                categories = Reference(ws, min_col=10, min_row=chart_start_row + 1,
-                                      max_row=chart_start_row + len(scaling_data))
-                chart1.add_data(data, titles_from_data=True)
-                chart1.set_categories(categories)
-                chart1.width = 12
-                chart1.height = 8
+                chart_rows = self._numeric_rows(scaling_data, [
+                    'num_producers', 'per_producer_throughput', 'ideal_throughput',
+                ])
+
+                chart_headers = ['Producers', 'Actual Per-Producer', 'Ideal (Linear)']
+                self._write_chart_data(ws, chart_start_row, 10, chart_headers, (
+                    (int(num_producers), round(per_producer_throughput, 2), round(ideal_throughput, 2))
+                    for num_producers, per_producer_throughput, ideal_throughput in chart_rows
+                ))
+
+                chart1 = self._new_chart(LineChart, "Throughput per Producer: Actual vs Ideal", "MB/sec per Producer",
+                                         x_title="Number of Producers")
+
+                self._plot_staged_data(chart1, ws, chart_start_row, 10, len(scaling_data), series_count=2)
 
                 ws.add_chart(chart1, f'A{chart_start_row}')
 
                 # =======================================================================
                 # CHART 2: Aggregate Throughput (Area Chart)
                 # =======================================================================
-                ws.cell(row=chart_start_row, column=14, value='Producers')
-                ws.cell(row=chart_start_row, column=15, value='Total Throughput')
-
-                for idx, r in scaling_data.iterrows():
-                    ws.cell(row=chart_start_row + 1 + idx, column=14, value=int(r['num_producers']))
-                    ws.cell(row=chart_start_row + 1 + idx, column=15, value=round(r['total_throughput'], 2))
-
-                chart2 = AreaChart()
-                chart2.title = "Aggregate Throughput by Producer Count"
-                chart2.style = self.CHART_STYLE
-                chart2.y_axis.title = "Total MB/sec"
-                chart2.x_axis.title = "Number of Producers"
-
-                data = Reference(ws, min_col=15, min_row=chart_start_row,
-                                max_row=chart_start_row + len(scaling_data))
-                categories = Reference(ws, min_col=14, min_row=chart_start_row + 1,
-                                      max_row=chart_start_row + len(scaling_data))
-                chart2.add_data(data, titles_from_data=True)
-                chart2.set_categories(categories)
-                chart2.width = 12
-                chart2.height = 8
+                chart_rows = self._numeric_rows(scaling_data, ['num_producers', 'total_throughput'])
+
+                self._write_chart_data(ws, chart_start_row, 14, ['Producers', 'Total Throughput'], (
+                    (int(num_producers), round(total_throughput, 2))
+                    for num_producers, total_throughput in chart_rows
+                ))
+
+                chart2 = self._new_chart(AreaChart, "Aggregate Throughput by Producer Count", "Total MB/sec",
+                                         x_title="Number of Producers")
+
+                self._plot_staged_data(chart2, ws, chart_start_row, 14, len(scaling_data))
 
                 ws.add_chart(chart2, f'G{chart_start_row}')
 
@@ -1517,27 +1625,15 @@ class KafkaPerformanceReporter:
                 # =======================================================================
                 chart3_row = chart_start_row + 18
 
-                ws.cell(row=chart3_row, column=10, value='Producers')
-                ws.cell(row=chart3_row, column=11, value='Avg Latency (ms)')
+                chart_rows = self._numeric_rows(scaling_data, ['num_producers', 'avg_latency'])
 
-                for idx, r in scaling_data.iterrows():
-                    ws.cell(row=chart3_row + 1 + idx, column=10, value=int(r['num_producers']))
-                    ws.cell(row=chart3_row + 1 + idx, column=11, value=round(r['avg_latency'], 1))
+                self._write_chart_data(ws, chart3_row, 10, ['Producers', 'Avg Latency (ms)'], (
+                    (int(num_producers), round(avg_latency, 1)) for num_producers, avg_latency in chart_rows
+                ))
 
-                chart3 = BarChart()
-                chart3.type = "col"
-                chart3.title = "Latency Impact with Scaling"
-                chart3.style = self.CHART_STYLE
-                chart3.y_axis.title = "Latency (ms)"
+                chart3 = self._new_chart(BarChart, "Latency Impact with Scaling", "Latency (ms)")
 
-                data = Reference(ws, min_col=11, min_row=chart3_row,
-                                max_row=chart3_row + len(scaling_data))
-                categories = Reference(ws, min_col=10, min_row=chart3_row + 1,
-                                      max_row=chart3_row + len(scaling_data))
-                chart3.add_data(data, titles_from_data=True)
-                chart3.set_categories(categories)
-                chart3.width = 12
-                chart3.height = 8
+                self._plot_staged_data(chart3, ws, chart3_row, 10, len(scaling_data))
 
                 ws.add_chart(chart3, f'A{chart3_row}')
 
@@ -1553,54 +1649,39 @@ class KafkaPerformanceReporter:
         ws[f'A{row}'].font = self.SECTION_FONT
         row += 1
 
-        if not self.consumer_df.empty and 'num_consumers' in self.consumer_df.columns:
-            consumer_scaling = self.consumer_df.groupby('num_consumers').agg({
+        if self.has_consumer and 'num_consumers' in self.consumer_df.columns:
+            consumer_scaling = self.consumer_df.groupby('num_consumers', as_index=False).agg({
                 'throughput_mb_sec': 'mean',
                 'rebalance_time_ms': 'mean'
-            }).reset_index()
+            })
 
             # Write data table
             headers = ['Num Consumers', 'Avg Throughput (MB/sec)', 'Avg Rebalance Time (ms)']
-            for col, header in enumerate(headers, 1):
-                cell = ws.cell(row=row, column=col, value=header)
-                cell.fill = self.HEADER_FILL
-                cell.font = self.HEADER_FONT
-                cell.border = self.BORDER
+            self._write_header_row(ws, row, headers)
             row += 1
 
-            for _, r in consumer_scaling.iterrows():
-                ws.cell(row=row, column=1, value=int(r['num_consumers']))
-                ws.cell(row=row, column=2, value=round(r['throughput_mb_sec'], 2))
-                ws.cell(row=row, column=3, value=round(r['rebalance_time_ms'], 0))
-                for col in range(1, 4):
-                    ws.cell(row=row, column=col).border = self.BORDER
-                row += 1
+            table_rows = self._numeric_rows(consumer_scaling, [
+                'num_consumers', 'throughput_mb_sec', 'rebalance_time_ms',
+            ])
+            row = self._write_table_rows(ws, row, (
+                (int(num_consumers), round(throughput, 2), round(rebalance_time, 0))
+                for num_consumers, throughput, rebalance_time in table_rows
+            ))
 
             # Consumer throughput chart
             if len(consumer_scaling) > 1:
                 chart_row = row + 2
 
-                ws.cell(row=chart_row, column=10, value='Consumers')
-                ws.cell(row=chart_row, column=11, value='Throughput')
+                chart_rows = self._numeric_rows(consumer_scaling, ['num_consumers', 'throughput_mb_sec'])
 
-                for idx, r in consumer_scaling.iterrows():
-                    ws.cell(row=chart_row + 1 + idx, column=10, value=int(r['num_consumers']))
-                    ws.cell(row=chart_row + 1 + idx, column=11, value=round(r['throughput_mb_sec'], 2))
+                self._write_chart_data(ws, chart_row, 10, ['Consumers', 'Throughput'], (
+                    (int(num_consumers), round(throughput_mb_sec, 2))
+                    for num_consumers, throughput_mb_sec in chart_rows
+                ))
 
-                chart = BarChart()
-                chart.type = "col"
-                chart.title = "Consumer Throughput by Scale"
-                chart.style = self.CHART_STYLE
-                chart.y_axis.title = "MB/sec"
+                chart = self._new_chart(BarChart, "Consumer Throughput by Scale", "MB/sec")
 
-                data = Reference(ws, min_col=11, min_row=chart_row,
-                                max_row=chart_row + len(consumer_scaling))
-                categories = Reference(ws, min_col=10, min_row=chart_row + 1,
-                                      max_row=chart_row + len(consumer_scaling))
-                chart.add_data(data, titles_from_data=True)
-                chart.set_categories(categories)
-                chart.width = 12
-                chart.height = 8
+                self._plot_staged_data(chart, ws, chart_row, 10, len(consumer_scaling))
 
                 ws.add_chart(chart, f'G{row + 2}')
         else:
@@ -1624,7 +1705,7 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Configuration Heatmap')
         self.log("Creating Configuration Heatmap sheet...")
 
-        if self.producer_df.empty:
+        if not self.has_producer:
             ws['A1'] = 'No producer test results available'
             return
 
@@ -1634,7 +1715,7 @@ class KafkaPerformanceReporter:
         ws.merge_cells('A1:H1')
 
         ws['A2'] = 'Multi-dimensional parameter interaction analysis (colors indicate performance)'
-        ws['A2'].font = Font(italic=True, color="666666")
+        ws['A2'].font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         # =======================================================================
@@ -1646,52 +1727,31 @@ class KafkaPerformanceReporter:
         row += 1
 
         # Create pivot table
-        pivot = self.producer_df.pivot_table(
-            values='throughput_mb',
-            index='acks',
-            columns='batch_size',
-            aggfunc='mean'
-        )
+        pivot = self._heatmap_pivot('throughput_mb', 'batch_size')
 
         if not pivot.empty:
             # Write column headers (batch_size values)
-            ws.cell(row=row, column=1, value='acks \\ batch_size')
-            ws.cell(row=row, column=1).font = self.HEADER_FONT
-            ws.cell(row=row, column=1).fill = self.HEADER_FILL
-            ws.cell(row=row, column=1).border = self.BORDER
-
-            for col_idx, batch in enumerate(pivot.columns):
-                cell = ws.cell(row=row, column=col_idx + 2, value=batch)
-                cell.fill = self.HEADER_FILL
-                cell.font = self.HEADER_FONT
-                cell.border = self.BORDER
+            self._write_header_row(ws, row, ['acks \\ batch_size', *pivot.columns])
             row += 1
 
             # Get min/max for color scaling
-            min_val = pivot.min().min()
-            max_val = pivot.max().max()
+            values = pivot.to_numpy(dtype=np.float64)
+            min_val = np.nanmin(values)
+            max_val = np.nanmax(values)
             val_range = max_val - min_val if max_val > min_val else 1
 
-            # Write data with conditional coloring
-            for acks_val in pivot.index:
-                ws.cell(row=row, column=1, value=str(acks_val))
-                ws.cell(row=row, column=1).font = Font(bold=True)
-                ws.cell(row=row, column=1).border = self.BORDER
+            # Write data with conditional coloring (green = high throughput, red = low)
+            fills = self._heatmap_fills((values - min_val) / val_range)
+            for acks_val, row_values, row_fills in zip(pivot.index, values, fills):
+                label_cell = ws.cell(row=row, column=1, value=str(acks_val))
+                label_cell.font = self.BOLD_FONT
+                label_cell.border = self.BORDER
 
-                for col_idx, batch in enumerate(pivot.columns):
-                    value = pivot.loc[acks_val, batch]
-                    cell = ws.cell(row=row, column=col_idx + 2, value=round(value, 1) if not pd.isna(value) else '')
+                for col_idx, (value, fill) in enumerate(zip(row_values, row_fills), 2):
+                    cell = ws.cell(row=row, column=col_idx, value=round(value, 1) if fill is not None else '')
                     cell.border = self.BORDER
-
-                    # Color based on value (green = high throughput, red = low)
-                    if not pd.isna(value):
-                        intensity = int(((value - min_val) / val_range) * 155) + 100
-                        # Green for high values
-                        cell.fill = PatternFill(
-                            start_color=f"{255-intensity:02X}{intensity:02X}50",
-                            end_color=f"{255-intensity:02X}{intensity:02X}50",
-                            fill_type="solid"
-                        )
+                    if fill is not None:
+                        cell.fill = fill
                 row += 1
 
             row += 2
@@ -1703,51 +1763,31 @@ class KafkaPerformanceReporter:
         ws[f'A{row}'].font = self.SECTION_FONT
         row += 1
 
-        pivot2 = self.producer_df.pivot_table(
-            values='avg_latency_ms',
-            index='acks',
-            columns='compression_type',
-            aggfunc='mean'
-        )
+        pivot2 = self._heatmap_pivot('avg_latency_ms', 'compression_type')
 
         if not pivot2.empty:
             # Write column headers
-            ws.cell(row=row, column=1, value='acks \\ compression')
-            ws.cell(row=row, column=1).font = self.HEADER_FONT
-            ws.cell(row=row, column=1).fill = self.HEADER_FILL
-            ws.cell(row=row, column=1).border = self.BORDER
-
-            for col_idx, comp in enumerate(pivot2.columns):
-                cell = ws.cell(row=row, column=col_idx + 2, value=comp)
-                cell.fill = self.HEADER_FILL
-                cell.font = self.HEADER_FONT
-                cell.border = self.BORDER
+            self._write_header_row(ws, row, ['acks \\ compression', *pivot2.columns])
             row += 1
 
             # Get min/max for color scaling
-            min_val = pivot2.min().min()
-            max_val = pivot2.max().max()
+            values = pivot2.to_numpy(dtype=np.float64)
+            min_val = np.nanmin(values)
+            max_val = np.nanmax(values)
             val_range = max_val - min_val if max_val > min_val else 1
 
-            # Write data with conditional coloring (inverted - green = low latency)
-            for acks_val in pivot2.index:
-                ws.cell(row=row, column=1, value=str(acks_val))
-                ws.cell(row=row, column=1).font = Font(bold=True)
-                ws.cell(row=row, column=1).border = self.BORDER
+            # Write data with conditional coloring (inverted - green = low latency, red = high)
+            fills = self._heatmap_fills((max_val - values) / val_range)
+            for acks_val, row_values, row_fills in zip(pivot2.index, values, fills):
+                label_cell = ws.cell(row=row, column=1, value=str(acks_val))
+                label_cell.font = self.BOLD_FONT
+                label_cell.border = self.BORDER
 
-                for col_idx, comp in enumerate(pivot2.columns):
-                    value = pivot2.loc[acks_val, comp]
-                    cell = ws.cell(row=row, column=col_idx + 2, value=round(value, 0) if not pd.isna(value) else '')
+                for col_idx, (value, fill) in enumerate(zip(row_values, row_fills), 2):
+                    cell = ws.cell(row=row, column=col_idx, value=round(value, 0) if fill is not None else '')
                     cell.border = self.BORDER
-
-                    # Color based on value (green = low latency, red = high)
-                    if not pd.isna(value):
-                        intensity = int(((max_val - value) / val_range) * 155) + 100
-                        cell.fill = PatternFill(
-                            start_color=f"{255-intensity:02X}{intensity:02X}50",
-                            end_color=f"{255-intensity:02X}{intensity:02X}50",
-                            fill_type="solid"
-                        )
+                    if fill is not None:
+                        cell.fill = fill
                 row += 1
 
             row += 2
@@ -1756,19 +1796,19 @@ class KafkaPerformanceReporter:
         # COLOR LEGEND
         # =======================================================================
         ws[f'A{row}'] = 'Color Legend:'
-        ws[f'A{row}'].font = Font(bold=True)
+        ws[f'A{row}'].font = self.BOLD_FONT
         row += 1
 
         ws[f'A{row}'] = 'Throughput Heatmap: Green = Higher throughput (better)'
-        ws[f'A{row}'].fill = PatternFill(start_color="64FF50", end_color="64FF50", fill_type="solid")
+        ws[f'A{row}'].fill = self.HEATMAP_HIGH_FILL
         ws[f'C{row}'] = 'Red = Lower throughput'
-        ws[f'C{row}'].fill = PatternFill(start_color="FF6450", end_color="FF6450", fill_type="solid")
+        ws[f'C{row}'].fill = self.HEATMAP_LOW_FILL
         row += 1
 
         ws[f'A{row}'] = 'Latency Heatmap: Green = Lower latency (better)'
-        ws[f'A{row}'].fill = PatternFill(start_color="64FF50", end_color="64FF50", fill_type="solid")
+        ws[f'A{row}'].fill = self.HEATMAP_HIGH_FILL
         ws[f'C{row}'] = 'Red = Higher latency'
-        ws[f'C{row}'].fill = PatternFill(start_color="FF6450", end_color="FF6450", fill_type="solid")
+        ws[f'C{row}'].fill = self.HEATMAP_LOW_FILL
         row += 2
 
         # =======================================================================
@@ -1780,8 +1820,10 @@ class KafkaPerformanceReporter:
 
         # Find optimal combinations
         if not self.producer_df.empty:
-            best_throughput = self.producer_df.loc[self.producer_df['throughput_mb'].idxmax()]
-            best_latency = self.producer_df.loc[self.producer_df['avg_latency_ms'].idxmin()]
+            throughput = self.producer_df['throughput_mb'].to_numpy(dtype=np.float64)
+            latency = self.producer_df['avg_latency_ms'].to_numpy(dtype=np.float64)
+            best_throughput = self.producer_df.iloc[int(np.nanargmax(throughput))]
+            best_latency = self.producer_df.iloc[int(np.nanargmin(latency))]
 
             ws[f'A{row}'] = f"Best Throughput: acks={best_throughput['acks']}, batch={best_throughput['batch_size']}, compression={best_throughput['compression_type']} -> {best_throughput['throughput_mb']:.1f} MB/sec"
             row += 1
@@ -1806,7 +1848,7 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Message Size Impact')
         self.log("Creating Message Size Impact sheet...")
 
-        if self.producer_df.empty:
+        if not self.has_producer:
             ws['A1'] = 'No producer test results available'
             return
 
@@ -1816,7 +1858,7 @@ class KafkaPerformanceReporter:
         ws.merge_cells('A1:H1')
 
         ws['A2'] = 'How message size affects throughput and efficiency'
-        ws['A2'].font = Font(italic=True, color="666666")
+        ws['A2'].font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         # =======================================================================
@@ -1828,33 +1870,26 @@ class KafkaPerformanceReporter:
         row += 1
 
         # Group by record_size
-        size_data = self.producer_df.groupby('record_size').agg({
-            'throughput_mb': 'mean',
-            'throughput_rps': 'mean',
-            'avg_latency_ms': 'mean',
-            'p99_ms': 'mean'
-        }).reset_index()
-        size_data = size_data.sort_values('record_size')
+        size_data = self.producer_df.groupby('record_size', as_index=False).agg(
+            throughput_mb=('throughput_mb', 'mean'),
+            throughput_rps=('throughput_rps', 'mean'),
+            avg_latency_ms=('avg_latency_ms', 'mean'),
+            p99_ms=('p99_ms', 'mean'),
+            test_count=('throughput_mb', 'size'),
+        )
 
         headers = ['Record Size (bytes)', 'Avg Throughput (MB/sec)', 'Avg Records/sec', 'Avg Latency (ms)', 'P99 Latency (ms)', 'Test Count']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = self.HEADER_FILL
-            cell.font = self.HEADER_FONT
-            cell.border = self.BORDER
+        self._write_header_row(ws, row, headers)
         row += 1
 
-        test_counts = self.producer_df.groupby('record_size').size()
-        for _, r in size_data.iterrows():
-            ws.cell(row=row, column=1, value=int(r['record_size']))
-            ws.cell(row=row, column=2, value=round(r['throughput_mb'], 2))
-            ws.cell(row=row, column=3, value=round(r['throughput_rps'], 0))
-            ws.cell(row=row, column=4, value=round(r['avg_latency_ms'], 1))
-            ws.cell(row=row, column=5, value=round(r['p99_ms'], 1))
-            ws.cell(row=row, column=6, value=test_counts.get(r['record_size'], 0))
-            for col in range(1, 7):
-                ws.cell(row=row, column=col).border = self.BORDER
-            row += 1
+        table_rows = self._numeric_rows(size_data, [
+            'record_size', 'throughput_mb', 'throughput_rps', 'avg_latency_ms', 'p99_ms', 'test_count',
+        ])
+        row = self._write_table_rows(ws, row, (
+            (int(record_size), round(throughput_mb, 2), round(throughput_rps, 0),
+             round(avg_latency, 1), round(p99, 1), test_count)
+            for record_size, throughput_mb, throughput_rps, avg_latency, p99, test_count in table_rows
+        ))
 
         chart_start_row = row + 2
 
@@ -1862,54 +1897,32 @@ class KafkaPerformanceReporter:
         # CHART 1: Throughput vs Message Size
         # =======================================================================
         if len(size_data) > 1:
-            ws.cell(row=chart_start_row, column=10, value='Size')
-            ws.cell(row=chart_start_row, column=11, value='Throughput')
-
-            for idx, r in size_data.iterrows():
-                ws.cell(row=chart_start_row + 1 + idx, column=10, value=int(r['record_size']))
-                ws.cell(row=chart_start_row + 1 + idx, column=11, value=round(r['throughput_mb'], 2))
-
-            chart1 = LineChart()
-            chart1.title = "Throughput vs Message Size"
-            chart1.style = self.CHART_STYLE
-            chart1.y_axis.title = "MB/sec"
-            chart1.x_axis.title = "Record Size (bytes)"
-
-            data = Reference(ws, min_col=11, min_row=chart_start_row,
-                            max_row=chart_start_row + len(size_data))
-            categories = Reference(ws, min_col=10, min_row=chart_start_row + 1,
-                                  max_row=chart_start_row + len(size_data))
-            chart1.add_data(data, titles_from_data=True)
-            chart1.set_categories(categories)
-            chart1.width = 12
-            chart1.height = 8
+            chart_rows = self._numeric_rows(size_data, ['record_size', 'throughput_mb'])
+
+            self._write_chart_data(ws, chart_start_row, 10, ['Size', 'Throughput'], (
+                (int(record_size), round(throughput_mb, 2)) for record_size, throughput_mb in chart_rows
+            ))
+
+            chart1 = self._new_chart(LineChart, "Throughput vs Message Size", "MB/sec",
+                                     x_title="Record Size (bytes)")
+
+            self._plot_staged_data(chart1, ws, chart_start_row, 10, len(size_data))
 
             ws.add_chart(chart1, f'A{chart_start_row}')
 
             # =======================================================================
             # CHART 2: Records/Sec vs Message Size
             # =======================================================================
-            ws.cell(row=chart_start_row, column=13, value='Size')
-            ws.cell(row=chart_start_row, column=14, value='Records/sec')
-
-            for idx, r in size_data.iterrows():
-                ws.cell(row=chart_start_row + 1 + idx, column=13, value=int(r['record_size']))
-                ws.cell(row=chart_start_row + 1 + idx, column=14, value=round(r['throughput_rps'], 0))
-
-            chart2 = LineChart()
-            chart2.title = "Records/Sec vs Message Size"
-            chart2.style = self.CHART_STYLE
-            chart2.y_axis.title = "Records/sec"
-            chart2.x_axis.title = "Record Size (bytes)"
-
-            data = Reference(ws, min_col=14, min_row=chart_start_row,
-                            max_row=chart_start_row + len(size_data))
-            categories = Reference(ws, min_col=13, min_row=chart_start_row + 1,
-                                  max_row=chart_start_row + len(size_data))
-            chart2.add_data(data, titles_from_data=True)
-            chart2.set_categories(categories)
-            chart2.width = 12
-            chart2.height = 8
+            chart_rows = self._numeric_rows(size_data, ['record_size', 'throughput_rps'])
+
+            self._write_chart_data(ws, chart_start_row, 13, ['Size', 'Records/sec'], (
+                (int(record_size), round(throughput_rps, 0)) for record_size, throughput_rps in chart_rows
+            ))
+
+            chart2 = self._new_chart(LineChart, "Records/Sec vs Message Size", "Records/sec",
+                                     x_title="Record Size (bytes)")
+
+            self._plot_staged_data(chart2, ws, chart_start_row, 13, len(size_data))
 
             ws.add_chart(chart2, f'G{chart_start_row}')
 
@@ -1918,29 +1931,17 @@ class KafkaPerformanceReporter:
             # =======================================================================
             chart3_row = chart_start_row + 18
 
-            ws.cell(row=chart3_row, column=10, value='Size')
-            ws.cell(row=chart3_row, column=11, value='Avg Latency')
-            ws.cell(row=chart3_row, column=12, value='P99 Latency')
-
-            for idx, r in size_data.iterrows():
-                ws.cell(row=chart3_row + 1 + idx, column=10, value=int(r['record_size']))
-                ws.cell(row=chart3_row + 1 + idx, column=11, value=round(r['avg_latency_ms'], 1))
-                ws.cell(row=chart3_row + 1 + idx, column=12, value=round(r['p99_ms'], 1))
-
-            chart3 = LineChart()
-            chart3.title = "Latency vs Message Size"
-            chart3.style = self.CHART_STYLE
-            chart3.y_axis.title = "Latency (ms)"
-            chart3.x_axis.title = "Record Size (bytes)"
-
-            data = Reference(ws, min_col=11, max_col=12, min_row=chart3_row,
-                            max_row=chart3_row + len(size_data))
-            categories = Reference(ws, min_col=10, min_row=chart3_row + 1,
-                                  max_row=chart3_row + len(size_data))
-            chart3.add_data(data, titles_from_data=True)
-            chart3.set_categories(categories)
-            chart3.width = 12
-            chart3.height = 8
+            chart_rows = self._numeric_rows(size_data, ['record_size', 'avg_latency_ms', 'p99_ms'])
+
+            self._write_chart_data(ws, chart3_row, 10, ['Size', 'Avg Latency', 'P99 Latency'], (
+                (int(record_size), round(avg_latency_ms, 1), round(p99_ms, 1))
+                for record_size, avg_latency_ms, p99_ms in chart_rows
+            ))
+
+            chart3 = self._new_chart(LineChart, "Latency vs Message Size", "Latency (ms)",
+                                     x_title="Record Size (bytes)")
+
+            self._plot_staged_data(chart3, ws, chart3_row, 10, len(size_data), series_count=2)
 
             ws.add_chart(chart3, f'A{chart3_row}')
 
@@ -1953,8 +1954,9 @@ class KafkaPerformanceReporter:
         insight_row += 1
 
         if not size_data.empty:
-            best_throughput_size = size_data.loc[size_data['throughput_mb'].idxmax(), 'record_size']
-            best_rps_size = size_data.loc[size_data['throughput_rps'].idxmax(), 'record_size']
+            record_sizes = size_data['record_size'].to_numpy()
+            best_throughput_size = record_sizes[np.nanargmax(size_data['throughput_mb'].to_numpy(dtype=np.float64))]
+            best_rps_size = record_sizes[np.nanargmax(size_data['throughput_rps'].to_numpy(dtype=np.float64))]
             ws[f'A{insight_row}'] = f"Best MB/sec at record size: {int(best_throughput_size)} bytes"
             insight_row += 1
             ws[f'A{insight_row}'] = f"Best records/sec at record size: {int(best_rps_size)} bytes"
@@ -1980,7 +1982,7 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Acks Comparison')
         self.log("Creating Acks Comparison sheet...")
 
-        if self.producer_df.empty:
+        if not self.has_producer:
             ws['A1'] = 'No producer test results available'
             return
 
@@ -1990,7 +1992,7 @@ class KafkaPerformanceReporter:
         ws.merge_cells('A1:H1')
 
         ws['A2'] = 'Trade-off analysis between data safety and throughput'
-        ws['A2'].font = Font(italic=True, color="666666")
+        ws['A2'].font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         # =======================================================================
@@ -2002,15 +2004,15 @@ class KafkaPerformanceReporter:
         row += 1
 
         explanations = [
-            ('acks=0', 'Fire-and-forget. No acknowledgment. FASTEST but messages can be lost.', 'FF6B6B'),
-            ('acks=1', 'Leader only. Waits for leader to write. BALANCED speed/safety.', 'FFD93D'),
-            ('acks=all/-1', 'All replicas. Waits for all in-sync replicas. SAFEST but slowest.', '6BCB77'),
+            ('acks=0', 'Fire-and-forget. No acknowledgment. FASTEST but messages can be lost.', '0'),
+            ('acks=1', 'Leader only. Waits for leader to write. BALANCED speed/safety.', '1'),
+            ('acks=all/-1', 'All replicas. Waits for all in-sync replicas. SAFEST but slowest.', 'all'),
         ]
 
-        for acks, desc, color in explanations:
+        for acks, desc, acks_key in explanations:
             ws[f'A{row}'] = acks
-            ws[f'A{row}'].font = Font(bold=True)
-            ws[f'A{row}'].fill = PatternFill(start_color=color, end_color=color, fill_type="solid")
+            ws[f'A{row}'].font = self.BOLD_FONT
+            ws[f'A{row}'].fill = self.ACKS_FILLS[acks_key]
             ws[f'B{row}'] = desc
             ws.merge_cells(f'B{row}:G{row}')
             row += 1
@@ -2024,97 +2026,66 @@ class KafkaPerformanceReporter:
         ws[f'A{row}'].font = self.SECTION_FONT
         row += 1
 
-        acks_data = self.producer_df.groupby('acks').agg({
-            'throughput_mb': ['mean', 'max'],
-            'avg_latency_ms': ['mean', 'min'],
-            'p99_ms': 'mean'
-        }).reset_index()
-        acks_data.columns = ['acks', 'avg_throughput', 'max_throughput', 'avg_latency', 'min_latency', 'p99_latency']
+        acks_data = self.producer_df.groupby('acks', as_index=False).agg(
+            avg_throughput=('throughput_mb', 'mean'),
+            max_throughput=('throughput_mb', 'max'),
+            avg_latency=('avg_latency_ms', 'mean'),
+            min_latency=('avg_latency_ms', 'min'),
+            p99_latency=('p99_ms', 'mean'),
+            test_count=('throughput_mb', 'size'),
+        )
 
         headers = ['acks', 'Avg Throughput', 'Max Throughput', 'Avg Latency', 'Min Latency', 'P99 Latency', 'Test Count']
-        for col, header in enumerate(headers, 1):
-            cell = ws.cell(row=row, column=col, value=header)
-            cell.fill = self.HEADER_FILL
-            cell.font = self.HEADER_FONT
-            cell.border = self.BORDER
+        self._write_header_row(ws, row, headers)
         row += 1
 
-        test_counts = self.producer_df.groupby('acks').size()
-        for _, r in acks_data.iterrows():
-            acks_val = str(r['acks'])
-            ws.cell(row=row, column=1, value=acks_val)
-
-            # Color code by acks value
-            acks_color = self.ACKS_COLORS.get(acks_val, 'FFFFFF')
-            ws.cell(row=row, column=1).fill = PatternFill(start_color=acks_color, end_color=acks_color, fill_type="solid")
-
-            ws.cell(row=row, column=2, value=round(r['avg_throughput'], 2))
-            ws.cell(row=row, column=3, value=round(r['max_throughput'], 2))
-            ws.cell(row=row, column=4, value=round(r['avg_latency'], 1))
-            ws.cell(row=row, column=5, value=round(r['min_latency'], 1))
-            ws.cell(row=row, column=6, value=round(r['p99_latency'], 1))
-            ws.cell(row=row, column=7, value=test_counts.get(r['acks'], 0))
-
-            for col in range(1, 8):
-                ws.cell(row=row, column=col).border = self.BORDER
-            row += 1
+        table_rows = acks_data[[
+            'acks', 'avg_throughput', 'max_throughput', 'avg_latency',
+            'min_latency', 'p99_latency', 'test_count',
+        ]].itertuples(index=False, name=None)
+        end_row = self._write_table_rows(ws, row, (
+            (str(acks), round(avg_throughput, 2), round(max_throughput, 2),
+             round(avg_latency, 1), round(min_latency, 1), round(p99_latency, 1), test_count)
+            for (acks, avg_throughput, max_throughput, avg_latency,
+                 min_latency, p99_latency, test_count) in table_rows
+        ))
+
+        # Color code by acks value
+        for acks_row in range(row, end_row):
+            acks_cell = ws.cell(row=acks_row, column=1)
+            acks_cell.fill = self.ACKS_FILLS.get(acks_cell.value, self.UNKNOWN_ACKS_FILL)
+        row = end_row
 
         chart_start_row = row + 2
 
         # =======================================================================
         # CHART 1: Throughput by acks
         # =======================================================================
-        ws.cell(row=chart_start_row, column=10, value='acks')
-        ws.cell(row=chart_start_row, column=11, value='Avg Throughput')
-
-        for idx, r in acks_data.iterrows():
-            ws.cell(row=chart_start_row + 1 + idx, column=10, value=str(r['acks']))
-            ws.cell(row=chart_start_row + 1 + idx, column=11, value=round(r['avg_throughput'], 2))
-
-        chart1 = BarChart()
-        chart1.type = "col"
-        chart1.title = "Throughput by acks Setting"
-        chart1.style = self.CHART_STYLE
-        chart1.y_axis.title = "MB/sec"
-        chart1.x_axis.title = "acks value"
-
-        data = Reference(ws, min_col=11, min_row=chart_start_row,
-                        max_row=chart_start_row + len(acks_data))
-        categories = Reference(ws, min_col=10, min_row=chart_start_row + 1,
-                              max_row=chart_start_row + len(acks_data))
-        chart1.add_data(data, titles_from_data=True)
-        chart1.set_categories(categories)
-        chart1.width = 12
-        chart1.height = 8
+        chart_rows = acks_data[['acks', 'avg_throughput']].itertuples(index=False, name=None)
+
+        self._write_chart_data(ws, chart_start_row, 10, ['acks', 'Avg Throughput'], (
+            (str(acks), round(avg_throughput, 2)) for acks, avg_throughput in chart_rows
+        ))
+
+        chart1 = self._new_chart(BarChart, "Throughput by acks Setting", "MB/sec", x_title="acks value")
+
+        self._plot_staged_data(chart1, ws, chart_start_row, 10, len(acks_data))
 
         ws.add_chart(chart1, f'A{chart_start_row}')
 
         # =======================================================================
         # CHART 2: Latency by acks
         # =======================================================================
-        ws.cell(row=chart_start_row, column=13, value='acks')
-        ws.cell(row=chart_start_row, column=14, value='Avg Latency')
-        ws.cell(row=chart_start_row, column=15, value='P99 Latency')
-
-        for idx, r in acks_data.iterrows():
-            ws.cell(row=chart_start_row + 1 + idx, column=13, value=str(r['acks']))
-            ws.cell(row=chart_start_row + 1 + idx, column=14, value=round(r['avg_latency'], 1))
-            ws.cell(row=chart_start_row + 1 + idx, column=15, value=round(r['p99_latency'], 1))
-
-        chart2 = BarChart()
-        chart2.type = "col"
-        chart2.title = "Latency by acks Setting"
-        chart2.style = self.CHART_STYLE
-        chart2.y_axis.title = "Latency (ms)"
-
-        data = Reference(ws, min_col=14, max_col=15, min_row=chart_start_row,
-                        max_row=chart_start_row + len(acks_data))
-        categories = Reference(ws, min_col=13, min_row=chart_start_row + 1,
-                              max_row=chart_start_row + len(acks_data))
-        chart2.add_data(data, titles_from_data=True)
-        chart2.set_categories(categories)
-        chart2.width = 12
-        chart2.height = 8
+        chart_rows = acks_data[['acks', 'avg_latency', 'p99_latency']].itertuples(index=False, name=None)
+
+        self._write_chart_data(ws, chart_start_row, 13, ['acks', 'Avg Latency', 'P99 Latency'], (
+            (str(acks), round(avg_latency, 1), round(p99_latency, 1))
+            for acks, avg_latency, p99_latency in chart_rows
+        ))
+
+        chart2 = self._new_chart(BarChart, "Latency by acks Setting", "Latency (ms)")
+
+        self._plot_staged_data(chart2, ws, chart_start_row, 13, len(acks_data), series_count=2)
 
         ws.add_chart(chart2, f'G{chart_start_row}')
 
@@ -2127,31 +2098,32 @@ class KafkaPerformanceReporter:
         analysis_row += 1
 
         # Calculate performance differences
-        acks0_data = acks_data[acks_data['acks'] == '0']
-        acksall_data = acks_data[(acks_data['acks'] == 'all') | (acks_data['acks'] == '-1')]
+        # One (throughput, latency) pair per acks value; '-1' sorts ahead of
+        # 'all' in acks_data, so it wins when both spellings are present
+        acks_metrics = dict(zip(acks_data['acks'], zip(acks_data['avg_throughput'], acks_data['avg_latency'])))
+        acks0_metrics = acks_metrics.get('0')
+        acksall_metrics = acks_metrics.get('-1', acks_metrics.get('all'))
 
-        if not acks0_data.empty and not acksall_data.empty:
-            acks0_throughput = acks0_data['avg_throughput'].iloc[0]
-            acksall_throughput = acksall_data['avg_throughput'].iloc[0]
-            acks0_latency = acks0_data['avg_latency'].iloc[0]
-            acksall_latency = acksall_data['avg_latency'].iloc[0]
+        if acks0_metrics is not None and acksall_metrics is not None:
+            acks0_throughput, acks0_latency = acks0_metrics
+            acksall_throughput, acksall_latency = acksall_metrics
 
             throughput_diff = ((acks0_throughput - acksall_throughput) / acksall_throughput) * 100 if acksall_throughput > 0 else 0
             latency_diff = ((acksall_latency - acks0_latency) / acks0_latency) * 100 if acks0_latency > 0 else 0
 
             ws[f'A{analysis_row}'] = f'Throughput cost of full durability (acks=0 vs acks=all):'
             ws[f'B{analysis_row}'] = f'{throughput_diff:.1f}% faster with acks=0'
-            ws[f'B{analysis_row}'].font = Font(bold=True, color='FF0000' if throughput_diff > 50 else '000000')
+            ws[f'B{analysis_row}'].font = self.ALERT_FONT if throughput_diff > 50 else self.NO_ALERT_FONT
             analysis_row += 1
 
             ws[f'A{analysis_row}'] = f'Latency cost of full durability:'
             ws[f'B{analysis_row}'] = f'{latency_diff:.1f}% higher with acks=all'
-            ws[f'B{analysis_row}'].font = Font(bold=True)
+            ws[f'B{analysis_row}'].font = self.BOLD_FONT
             analysis_row += 2
 
             # Recommendations
             ws[f'A{analysis_row}'] = 'RECOMMENDATIONS:'
-            ws[f'A{analysis_row}'].font = Font(bold=True, size=12)
+            ws[f'A{analysis_row}'].font = self.SUBHEADING_FONT
             analysis_row += 1
 
             if throughput_diff > 100:
@@ -2176,65 +2148,179 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Raw Data')
         self.log("Creating Raw Data sheet...")
 
-        # Combine all results into flat structure
-        all_rows = []
-
-        for r in self.producer_results:
-            config = r.get('configuration', {})
-            metrics = r.get('metrics', {})
-            all_rows.append({
-                'test_type': 'producer',
-                'scenario': r.get('scenario', ''),
-                'acks': config.get('acks', ''),
-                'batch_size': config.get('batch_size', ''),
-                'linger_ms': config.get('linger_ms', ''),
-                'compression_type': config.get('compression_type', config.get('compression', '')),
-                'record_size': config.get('record_size', ''),
-                'num_producers': config.get('num_producers', 1),
-                'records_sent': metrics.get('records_sent', ''),
-                'throughput_rps': metrics.get('throughput_rps', ''),
-                'throughput_mb': metrics.get('throughput_mb', ''),
-                'avg_latency_ms': metrics.get('avg_latency_ms', ''),
-                'max_latency_ms': metrics.get('max_latency_ms', ''),
-                'p50_ms': metrics.get('p50_ms', ''),
-                'p95_ms': metrics.get('p95_ms', ''),
-                'p99_ms': metrics.get('p99_ms', ''),
-                'p999_ms': metrics.get('p999_ms', ''),
-            })
+        # Combine all results into flat structure, built column by column
+        producer_columns: Dict[str, list] = {}
+        consumer_columns: Dict[str, list] = {}
+
+        if self.producer_results:
+            results = self.producer_results
+            configs = [r.get('configuration', {}) for r in results]
+            metrics = [r.get('metrics', {}) for r in results]
+            producer_columns = {
+                'test_type': ['producer'] * len(results),
+                'scenario': [r.get('scenario', '') for r in results],
+                'acks': [c.get('acks', '') for c in configs],
+                'batch_size': [c.get('batch_size', '') for c in configs],
+                'linger_ms': [c.get('linger_ms', '') for c in configs],
+                'compression_type': [c.get('compression_type', c.get('compression', '')) for c in configs],
+                'record_size': [c.get('record_size', '') for c in configs],
+                'num_producers': [c.get('num_producers', 1) for c in configs],
+                'records_sent': [m.get('records_sent', '') for m in metrics],
+                'throughput_rps': [m.get('throughput_rps', '') for m in metrics],
+                'throughput_mb': [m.get('throughput_mb', '') for m in metrics],
+                'avg_latency_ms': [m.get('avg_latency_ms', '') for m in metrics],
+                'max_latency_ms': [m.get('max_latency_ms', '') for m in metrics],
+                'p50_ms': [m.get('p50_ms', '') for m in metrics],
+                'p95_ms': [m.get('p95_ms', '') for m in metrics],
+                'p99_ms': [m.get('p99_ms', '') for m in metrics],
+                'p999_ms': [m.get('p999_ms', '') for m in metrics],
+            }
 
-        for r in self.consumer_results:
-            config = r.get('configuration', {})
-            metrics = r.get('metrics', {})
-            all_rows.append({
-                'test_type': 'consumer',
-                'scenario': r.get('scenario', ''),
-                'fetch_min_bytes': config.get('fetch_min_bytes', ''),
-                'max_poll_records': config.get('max_poll_records', ''),
-                'num_consumers': config.get('num_consumers', 1),
-                'throughput_mb': metrics.get('throughput_mb_sec', ''),
-                'throughput_rps': metrics.get('throughput_msg_sec', ''),
-                'data_consumed_mb': metrics.get('data_consumed_mb', ''),
-                'rebalance_time_ms': metrics.get('rebalance_time_ms', ''),
-                'fetch_time_ms': metrics.get('fetch_time_ms', ''),
-            })
+        if self.consumer_results:
+            results = self.consumer_results
+            configs = [r.get('configuration', {}) for r in results]
+            metrics = [r.get('metrics', {}) for r in results]
+            consumer_columns = {
+                'test_type': ['consumer'] * len(results),
+                'scenario': [r.get('scenario', '') for r in results],
+                'fetch_min_bytes': [c.get('fetch_min_bytes', '') for c in configs],
+                'max_poll_records': [c.get('max_poll_records', '') for c in configs],
+                'num_consumers': [c.get('num_consumers', 1) for c in configs],
+                'throughput_mb': [m.get('throughput_mb_sec', '') for m in metrics],
+                'throughput_rps': [m.get('throughput_msg_sec', '') for m in metrics],
+                'data_consumed_mb': [m.get('data_consumed_mb', '') for m in metrics],
+                'rebalance_time_ms': [m.get('rebalance_time_ms', '') for m in metrics],
+                'fetch_time_ms': [m.get('fetch_time_ms', '') for m in metrics],
+            }
 
-        if not all_rows:
+        if not producer_columns and not consumer_columns:
             ws['A1'] = 'No test data available'
             return
 
-        df = pd.DataFrame(all_rows)
+        # Columns that only one test type has are padded with NaN for the other
+        producer_pad = [np.nan] * len(self.producer_results)
+        consumer_pad = [np.nan] * len(self.consumer_results)
+        df = pd.DataFrame({
+            name: producer_columns.get(name, producer_pad) + consumer_columns.get(name, consumer_pad)
+            for name in {**producer_columns, **consumer_columns}
+        })
+
+        if self.split_raw:
+            raw_file = self._start_split_raw_data(df)
+            ws['A1'] = f'Raw data written to {raw_file.name}'
+            return
+
+        # Write data: styled header cells appended as one row, then the value
+        # rows with a shared border style
+        header = []
+        for name in df.columns:
+            cell = WriteOnlyCell(ws, value=name)
+            cell.fill = self.HEADER_FILL
+            cell.font = self.HEADER_FONT
+            cell.border = self.BORDER
+            header.append(cell)
+        ws.append(header)
 
-        # Write data
-        for r_idx, row in enumerate(dataframe_to_rows(df, index=False, header=True), 1):
-            for c_idx, value in enumerate(row, 1):
-                cell = ws.cell(row=r_idx, column=c_idx, value=value)
-                if r_idx == 1:
-                    cell.fill = self.HEADER_FILL
-                    cell.font = self.HEADER_FONT
-                cell.border = self.BORDER
+        self._write_table_rows(ws, 2, df.itertuples(index=False, name=None))
 
         self._auto_width_columns(ws)
 
+    def _start_split_raw_data(self, df: pd.DataFrame) -> Path:
+        """
+        Start writing the Raw Data table to a sibling workbook.
+
+        The raw workbook shares nothing with the main one, so it is written
+        in a worker process while the remaining sheets are built and the main
+        workbook is saved. Platforms without process support write it inline.
+
+        Args:
+            df: Flattened raw data table
+
+        Returns:
+            Path to the raw data workbook
+        """
+        raw_file = self.output_file.with_suffix('.raw.xlsx')
+        raw_file.parent.mkdir(parents=True, exist_ok=True)
+
+        try:
+            executor = ProcessPoolExecutor(max_workers=1)
+            future = executor.submit(self._write_split_raw_data, df, raw_file)
+        except (OSError, NotImplementedError, BrokenProcessPool):
+            self._write_split_raw_data(df, raw_file)
+            self.log(f"Raw data saved to: {raw_file}")
+        else:
+            self._raw_data_job = (executor, future, df, raw_file)
+        return raw_file
+
+    def _finish_split_raw_data(self) -> None:
+        """Wait for a raw data workbook started by _start_split_raw_data."""
+        if self._raw_data_job is None:
+            return
+
+        executor, future, df, raw_file = self._raw_data_job
+        self._raw_data_job = None
+        try:
+            future.result()
+        except BrokenProcessPool:
+            # The worker could not run (e.g. no fork/spawn in a sandbox)
+            self._write_split_raw_data(df, raw_file)
+        finally:
+            executor.shutdown()
+        self.log(f"Raw data saved to: {raw_file}")
+
+    @classmethod
+    def _write_split_raw_data(cls, df: pd.DataFrame, raw_file: Path) -> None:
+        """
+        Write the Raw Data table to a sibling workbook.
+
+        Both writers stream rows to disk instead of building a cell grid:
+        xlsxwriter when installed, otherwise openpyxl in write-only mode. The
+        main workbook keeps the charts, which write-only sheets cannot host
+        alongside merged cells and positioned writes.
+
+        Args:
+            df: Flattened raw data table
+            raw_file: Path to the raw data workbook
+        """
+        widths = [min(max(len(name), 10) + 2, 50) for name in df.columns]
+
+        # Missing values become empty cells in both writers
+        values = df.astype(object).where(df.notna(), None)
+
+        if xlsxwriter is not None:
+            # constant_memory flushes each row once the next one starts, so the
+            # header and column widths must be written before any data row
+            raw_wb = xlsxwriter.Workbook(str(raw_file), {'constant_memory': True, 'strings_to_numbers': False})
+            raw_ws = raw_wb.add_worksheet('Raw Data')
+            header_format = raw_wb.add_format({
+                'bold': True, 'font_color': '#FFFFFF', 'bg_color': '#1F4E78', 'border': 1,
+            })
+            for col_idx, width in enumerate(widths):
+                raw_ws.set_column(col_idx, col_idx, width)
+            raw_ws.write_row(0, 0, df.columns, header_format)
+
+            for row_idx, row in enumerate(values.itertuples(index=False, name=None), 1):
+                raw_ws.write_row(row_idx, 0, row)
+            raw_wb.close()
+        else:
+            raw_wb = openpyxl.Workbook(write_only=True)
+            raw_ws = raw_wb.create_sheet('Raw Data')
+            for col_idx, width in enumerate(widths, 1):
+                raw_ws.column_dimensions[get_column_letter(col_idx)].width = width
+
+            header = []
+            for name in df.columns:
+                cell = WriteOnlyCell(raw_ws, value=name)
+                cell.fill = cls.HEADER_FILL
+                cell.font = cls.HEADER_FONT
+                cell.border = cls.BORDER
+                header.append(cell)
+            raw_ws.append(header)
+
+            for row in values.itertuples(index=False, name=None):
+                raw_ws.append(row)
+            raw_wb.save(raw_file)
+
     # ==========================================================================
     # SHEET 10: RECOMMENDATIONS
     # ==========================================================================
@@ -2253,7 +2339,7 @@ class KafkaPerformanceReporter:
         ws = self.wb.create_sheet('Recommendations')
         self.log("Creating Recommendations sheet...")
 
-        if self.producer_df.empty:
+        if not self.has_producer:
             ws['A1'] = 'No test results available for recommendations'
             return
 
@@ -2263,7 +2349,7 @@ class KafkaPerformanceReporter:
         ws.merge_cells('A1:H1')
 
         ws['A2'] = 'Optimal configurations identified from your test results'
-        ws['A2'].font = Font(italic=True, color="666666")
+        ws['A2'].font = self.NOTE_FONT
         ws.merge_cells('A2:H2')
 
         scored_df = self.scores.get('scored_df', self.producer_df)
@@ -2273,45 +2359,45 @@ class KafkaPerformanceReporter:
         # USE CASE 1: MAXIMUM THROUGHPUT
         # =======================================================================
         ws[f'A{row}'] = 'USE CASE 1: MAXIMUM THROUGHPUT'
-        ws[f'A{row}'].font = Font(bold=True, size=12, color="FFFFFF")
-        ws[f'A{row}'].fill = PatternFill(start_color="1F4E78", end_color="1F4E78", fill_type="solid")
+        ws[f'A{row}'].font = self.BANNER_FONT
+        ws[f'A{row}'].fill = self.HEADER_FILL
         ws.merge_cells(f'A{row}:F{row}')
         row += 1
 
-        if self.scores.get('best_throughput_idx') is not None:
-            best = scored_df.loc[self.scores['best_throughput_idx']]
-            self._write_recommendation_box(ws, row, best, 'throughput')
+        if self.scores.get('best_throughput_row') is not None:
+            best = self.scores['best_throughput_row']
+            self._write_recommendation_box(ws, row, best, 'score_max_throughput')
             row += 12
 
         # =======================================================================
         # USE CASE 2: BALANCED PERFORMANCE
         # =======================================================================
         ws[f'A{row}'] = 'USE CASE 2: BALANCED PERFORMANCE'
-        ws[f'A{row}'].font = Font(bold=True, size=12, color="FFFFFF")
-        ws[f'A{row}'].fill = PatternFill(start_color="2E75B6", end_color="2E75B6", fill_type="solid")
+        ws[f'A{row}'].font = self.BANNER_FONT
+        ws[f'A{row}'].fill = self.KPI_HEADER_FILL
         ws.merge_cells(f'A{row}:F{row}')
         row += 1
 
-        if self.scores.get('best_balanced_idx') is not None:
-            best = scored_df.loc[self.scores['best_balanced_idx']]
-            self._write_recommendation_box(ws, row, best, 'balanced')
+        if self.scores.get('best_balanced_row') is not None:
+            best = self.scores['best_balanced_row']
+            self._write_recommendation_box(ws, row, best, 'score_balanced')
             row += 12
 
         # =======================================================================
         # USE CASE 3: MISSION-CRITICAL (DURABILITY)
         # =======================================================================
         ws[f'A{row}'] = 'USE CASE 3: MISSION-CRITICAL (DURABILITY FIRST)'
-        ws[f'A{row}'].font = Font(bold=True, size=12, color="FFFFFF")
-        ws[f'A{row}'].fill = PatternFill(start_color="6BCB77", end_color="6BCB77", fill_type="solid")
+        ws[f'A{row}'].font = self.BANNER_FONT
+        ws[f'A{row}'].fill = self.BANNER_GREEN_FILL
         ws.merge_cells(f'A{row}:F{row}')
         row += 1
 
         # Find best config with acks=all or acks=-1
-        durable_configs = scored_df[(scored_df['acks'] == 'all') | (scored_df['acks'] == '-1')]
-        if not durable_configs.empty:
-            best_durable_idx = durable_configs['score_durability'].idxmax()
-            best = scored_df.loc[best_durable_idx]
-            self._write_recommendation_box(ws, row, best, 'durability')
+        durable = scored_df['acks'].isin(('all', '-1')).to_numpy()
+        if durable.any():
+            durability_scores = np.where(durable, scored_df['score_durability'].to_numpy(dtype=np.float64), np.nan)
+            best = scored_df.iloc[int(np.nanargmax(durability_scores))]
+            self._write_recommendation_box(ws, row, best, 'score_durability')
             row += 12
         else:
             ws[f'A{row}'] = 'No tests with acks=all found. Run tests with acks=all for durability recommendations.'
@@ -2321,8 +2407,8 @@ class KafkaPerformanceReporter:
         # SCORING METHODOLOGY
         # =======================================================================
         ws[f'A{row}'] = 'SCORING METHODOLOGY'
-        ws[f'A{row}'].font = Font(bold=True, size=12, color="FFFFFF")
-        ws[f'A{row}'].fill = PatternFill(start_color="666666", end_color="666666", fill_type="solid")
+        ws[f'A{row}'].font = self.BANNER_FONT
+        ws[f'A{row}'].fill = self.BANNER_GREY_FILL
         ws.merge_cells(f'A{row}:F{row}')
         row += 2
 
@@ -2347,13 +2433,16 @@ class KafkaPerformanceReporter:
         # WHEN TO ADJUST SETTINGS
         # =======================================================================
         ws[f'A{row}'] = 'WHEN TO ADJUST THESE SETTINGS'
-        ws[f'A{row}'].font = Font(bold=True, size=12, color="FFFFFF")
-        ws[f'A{row}'].fill = PatternFill(start_color="666666", end_color="666666", fill_type="solid")
+        ws[f'A{row}'].font = self.BANNER_FONT
+        ws[f'A{row}'].fill = self.BANNER_GREY_FILL
         ws.merge_cells(f'A{row}:F{row}')
         row += 2
 
+        ws.cell(row=row, column=1, value='IF YOU OBSERVE:').font = self.BOLD_FONT
+        ws.cell(row=row, column=4, value='ADJUST:').font = self.BOLD_FONT
+        row += 1
+
         adjustments = [
-            ('IF YOU OBSERVE:', 'ADJUST:'),
             ('Low throughput, high P99 latency', 'Increase batch.size'),
             ('Good throughput but spiky latency', 'Increase linger.ms'),
             ('High CPU on producer', 'Reduce compression or increase batch.size'),
@@ -2361,54 +2450,46 @@ class KafkaPerformanceReporter:
             ('Replication lag too high', 'Reduce num.producers or increase broker replicas'),
         ]
 
+        cell = ws.cell
         for observe, adjust in adjustments:
-            ws[f'A{row}'] = observe
-            ws[f'A{row}'].font = Font(bold=True) if observe == 'IF YOU OBSERVE:' else None
-            ws[f'D{row}'] = adjust
-            ws[f'D{row}'].font = Font(bold=True) if adjust == 'ADJUST:' else None
+            cell(row=row, column=1, value=observe)
+            cell(row=row, column=4, value=adjust)
             row += 1
 
         self._auto_width_columns(ws)
 
-    def _write_recommendation_box(self, ws, start_row: int, config, use_case: str) -> None:
-        """Write a recommendation box for a specific use case."""
-        row = start_row
-
-        # Configuration
-        ws[f'A{row}'] = 'Configuration:'
-        ws[f'A{row}'].font = Font(bold=True)
-        row += 1
-
-        ws[f'A{row}'] = f"  acks = {config['acks']}"
-        row += 1
-        ws[f'A{row}'] = f"  batch.size = {config['batch_size']}"
-        row += 1
-        ws[f'A{row}'] = f"  linger.ms = {config['linger_ms']}"
-        row += 1
-        ws[f'A{row}'] = f"  compression.type = {config['compression_type']}"
-        row += 1
-        ws[f'A{row}'] = f"  record.size = {config['record_size']}"
-        row += 1
-
-        # Expected Performance
-        row += 1
-        ws[f'A{row}'] = 'Expected Performance:'
-        ws[f'A{row}'].font = Font(bold=True)
-        row += 1
-
-        ws[f'A{row}'] = f"  Throughput: {config['throughput_mb']:.2f} MB/sec ({config['throughput_rps']:,.0f} records/sec)"
-        ws[f'A{row}'].fill = self.GOOD_FILL if config['throughput_mb'] > 50 else None
-        row += 1
-        ws[f'A{row}'] = f"  Avg Latency: {config['avg_latency_ms']:.0f} ms"
-        row += 1
-        ws[f'A{row}'] = f"  P99 Latency: {config['p99_ms']:.0f} ms"
-        row += 1
+    def _write_recommendation_box(self, ws, start_row: int, config, score_col: str) -> None:
+        """Write a recommendation box for a specific use case, scored by its score_col."""
+        # One line per row; None leaves a spacer row
+        lines = [
+            'Configuration:',
+            f"  acks = {config['acks']}",
+            f"  batch.size = {config['batch_size']}",
+            f"  linger.ms = {config['linger_ms']}",
+            f"  compression.type = {config['compression_type']}",
+            f"  record.size = {config['record_size']}",
+            None,
+            'Expected Performance:',
+            f"  Throughput: {config['throughput_mb']:.2f} MB/sec ({config['throughput_rps']:,.0f} records/sec)",
+            f"  Avg Latency: {config['avg_latency_ms']:.0f} ms",
+            f"  P99 Latency: {config['p99_ms']:.0f} ms",
+        ]
+        bold_lines = {0, 7}
 
         # Score
-        score_col = f'score_{use_case}' if use_case != 'throughput' else 'score_max_throughput'
         if score_col in config:
-            ws[f'A{row}'] = f"  Score: {config[score_col]:.0f}/100"
-            ws[f'A{row}'].font = Font(bold=True)
+            bold_lines.add(len(lines))
+            lines.append(f"  Score: {config[score_col]:.0f}/100")
+
+        cell = ws.cell
+        for offset, text in enumerate(lines):
+            if text is not None:
+                line_cell = cell(row=start_row + offset, column=1, value=text)
+                if offset in bold_lines:
+                    line_cell.font = self.BOLD_FONT
+
+        # Highlight the throughput line above 50 MB/sec
+        cell(row=start_row + 8, column=1).fill = self.GOOD_FILL if config['throughput_mb'] > 50 else None
 
 
 def main():
@@ -2421,6 +2502,7 @@ Examples:
   %(prog)s parsed_results.json kafka_report.xlsx
   %(prog)s ./results/parsed_data/results.json ./results/reports/report.xlsx
   %(prog)s -i parsed.json -o report.xlsx --verbose
+  %(prog)s parsed.json report.xlsx --split-raw
 
 Output:
   Creates a 10-sheet Excel workbook with 30+ visualizations including:
@@ -2463,6 +2545,12 @@ Output:
         help='Enable verbose output'
     )
 
+    parser.add_argument(
+        '--split-raw',
+        action='store_true',
+        help='Write Raw Data to a separate <output>.raw.xlsx (faster for large result sets, fastest with xlsxwriter)'
+    )
+
     args = parser.parse_args()
 
     # Handle alternative argument forms
@@ -2470,7 +2558,8 @@ Output:
     output_xlsx = args.output_opt or args.output_xlsx
 
     # Generate report
-    reporter = KafkaPerformanceReporter(input_json, output_xlsx, verbose=args.verbose)
+    reporter = KafkaPerformanceReporter(input_json, output_xlsx, verbose=args.verbose,
+                                        split_raw=args.split_raw)
     output_file = reporter.generate_report()
 
     print(f"\n{'='*60}")
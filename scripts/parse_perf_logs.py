@@ -14,13 +14,23 @@ Example:
 """
 
 import re
+import hashlib
 import json
+import mmap
 import os
 import sys
 import argparse
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
 from pathlib import Path
 from datetime import datetime
-from typing import Dict, List, Optional, Any
+from itertools import chain
+from typing import Dict, List, Optional, Any, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None  # Optional, falls back to the standard library json module
 
 
 class KafkaPerformanceParser:
@@ -31,10 +41,13 @@ class KafkaPerformanceParser:
     extracting configuration metadata and performance metrics.
     """
 
-    # Producer output pattern - matches final summary line
+    # Producer output pattern - matches the final summary line and, with the
+    # percentile groups left empty, intermediate progress lines
     # Example: 1000000 records sent, 14637.645096 records/sec (28.59 MB/sec),
     #          3182.27 ms avg latency, 3613.00 ms max latency,
     #          3289 ms 50th, 3467 ms 95th, 3568 ms 99th, 3603 ms 99.9th.
+    # Progress: 73681 records sent, 14733.3 records/sec (14.39 MB/sec),
+    #           1876.4 ms avg latency, 2957.0 ms max latency.
     PRODUCER_FINAL_PATTERN = re.compile(
         r'(\d+)\s+records sent,\s+'
         r'([\d.]+)\s+records/sec\s+\(([\d.]+)\s+MB/sec\),\s+'
@@ -46,14 +59,6 @@ class KafkaPerformanceParser:
         r'(?:,\s+(\d+)\s+ms 99\.9th)?'
     )
 
-    # Producer intermediate output pattern (progress lines)
-    PRODUCER_PROGRESS_PATTERN = re.compile(
-        r'(\d+)\s+records sent,\s+'
-        r'([\d.]+)\s+records/sec\s+\(([\d.]+)\s+MB/sec\),\s+'
-        r'([\d.]+)\s+ms avg latency,\s+'
-        r'([\d.]+)\s+ms max latency\.'
-    )
-
     # Consumer output pattern - CSV format
     # Example: 2024-08-28 12:00:45:269, 2024-08-28 12:01:53:199, 1953.1250, 28.7520,
     #          1000000, 14721.0364, 3330, 64600, 30.2341, 15479.8762
@@ -73,7 +78,34 @@ class KafkaPerformanceParser:
     HOST_PATTERN = re.compile(r'#\s*Host:\s*(.+)')
     DATE_PATTERN = re.compile(r'#\s*Date:\s*(.+)')
 
-    def __init__(self, log_dir: str, output_dir: str, verbose: bool = False):
+    # Decimal config values such as linger.ms=1.5
+    DECIMAL_VALUE_PATTERN = re.compile(r'\d+\.\d*|\.\d+')
+
+    # Logs are parsed in worker processes once there are at least this many
+    # per worker; below it process start-up costs more than it saves
+    PARALLEL_MIN_FILES = 200
+
+    # Sidecar in the output directory holding results of earlier runs, keyed
+    # by resolved log path; no .json suffix so aggregation does not pick it up
+    CACHE_FILENAME = '.parse_cache'
+
+    # Bump when the cache layout changes. Caches are also discarded whenever
+    # this script changes, so results from an older parser are never reused
+    CACHE_VERSION = 1
+
+    # Configuration patterns from the filename convention
+    FILENAME_PATTERNS = {
+        'acks': re.compile(r'acks[_-]?(\w+)', re.IGNORECASE),
+        'batch': re.compile(r'batch[_-]?(\d+)', re.IGNORECASE),
+        'linger': re.compile(r'linger[_-]?(\d+)', re.IGNORECASE),
+        'size': re.compile(r'size[_-]?(\d+)', re.IGNORECASE),
+        'compression': re.compile(r'(none|snappy|lz4|zstd|gzip)', re.IGNORECASE),
+        'fetch': re.compile(r'fetch[_-]?(\d+)', re.IGNORECASE),
+        'poll': re.compile(r'poll[_-]?(\d+)', re.IGNORECASE),
+    }
+
+    def __init__(self, log_dir: str, output_dir: str, verbose: bool = False,
+                 use_cache: bool = True):
         """
         Initialize the parser.
 
@@ -81,10 +113,16 @@ class KafkaPerformanceParser:
             log_dir: Directory containing raw log files
             output_dir: Directory to write parsed JSON output
             verbose: Enable verbose logging
+            use_cache: Reuse results for logs unchanged since the last run
         """
         self.log_dir = Path(log_dir)
         self.output_dir = Path(output_dir)
         self.verbose = verbose
+        self.use_cache = use_cache
+
+        # Shared parse_time stamp while parse_all_logs runs; single-file
+        # parses stamp their own
+        self._batch_parse_time: Optional[str] = None
 
         # Ensure output directory exists
         self.output_dir.mkdir(parents=True, exist_ok=True)
@@ -106,52 +144,45 @@ class KafkaPerformanceParser:
         """
         self.log(f"Parsing producer log: {filepath.name}")
 
+        # Only the header block and the last line that can hold a summary are
+        # read, not the progress output before it
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+                header, _ = self._read_header(f)
+            summary_line = self._read_last_line_with(filepath, b'records sent')
         except Exception as e:
             print(f"[ERROR] Failed to read {filepath}: {e}")
             return None
 
         # Extract configuration from header comments
-        config = self._extract_config_from_content(content)
+        config = self._extract_config_from_content(header)
         config.update(self._extract_config_from_filename(filepath, 'producer'))
 
-        # Find all producer output lines and get the final summary
+        # Get the final summary from the last producer output line
+        content = summary_line or ''
         final_matches = list(self.PRODUCER_FINAL_PATTERN.finditer(content))
+        if not final_matches and summary_line is not None:
+            # The last line was cut short (e.g. an interrupted run), so fall
+            # back to the most recent complete line anywhere in the log
+            content = filepath.read_text(encoding='utf-8')
+            final_matches = list(self.PRODUCER_FINAL_PATTERN.finditer(content))
 
         if not final_matches:
-            # Try progress pattern if final pattern doesn't match
-            progress_matches = list(self.PRODUCER_PROGRESS_PATTERN.finditer(content))
-            if progress_matches:
-                match = progress_matches[-1]
-                metrics = {
-                    'records_sent': int(match.group(1)),
-                    'throughput_rps': float(match.group(2)),
-                    'throughput_mb': float(match.group(3)),
-                    'avg_latency_ms': float(match.group(4)),
-                    'max_latency_ms': float(match.group(5)),
-                    'p50_ms': None,
-                    'p95_ms': None,
-                    'p99_ms': None,
-                    'p999_ms': None,
-                }
-            else:
-                print(f"[WARN] No producer metrics found in {filepath.name}")
-                return None
-        else:
-            match = final_matches[-1]
-            metrics = {
-                'records_sent': int(match.group(1)),
-                'throughput_rps': float(match.group(2)),
-                'throughput_mb': float(match.group(3)),
-                'avg_latency_ms': float(match.group(4)),
-                'max_latency_ms': float(match.group(5)),
-                'p50_ms': int(match.group(6)) if match.group(6) else None,
-                'p95_ms': int(match.group(7)) if match.group(7) else None,
-                'p99_ms': int(match.group(8)) if match.group(8) else None,
-                'p999_ms': int(match.group(9)) if match.group(9) else None,
-            }
+            print(f"[WARN] No producer metrics found in {filepath.name}")
+            return None
+
+        match = final_matches[-1]
+        metrics = {
+            'records_sent': int(match.group(1)),
+            'throughput_rps': float(match.group(2)),
+            'throughput_mb': float(match.group(3)),
+            'avg_latency_ms': float(match.group(4)),
+            'max_latency_ms': float(match.group(5)),
+            'p50_ms': int(match.group(6)) if match.group(6) else None,
+            'p95_ms': int(match.group(7)) if match.group(7) else None,
+            'p99_ms': int(match.group(8)) if match.group(8) else None,
+            'p999_ms': int(match.group(9)) if match.group(9) else None,
+        }
 
         return {
             'test_type': 'producer',
@@ -160,7 +191,7 @@ class KafkaPerformanceParser:
             'metrics': metrics,
             'filepath': str(filepath),
             'filename': filepath.name,
-            'parse_time': datetime.now().isoformat()
+            'parse_time': self._batch_parse_time or datetime.now().isoformat()
         }
 
     def parse_consumer_log(self, filepath: Path) -> Optional[Dict[str, Any]]:
@@ -175,40 +206,40 @@ class KafkaPerformanceParser:
         """
         self.log(f"Parsing consumer log: {filepath.name}")
 
+        # Stream the log and stop at the first metrics line (skipping the CSV
+        # header line)
+        metrics = {}
         try:
             with open(filepath, 'r', encoding='utf-8') as f:
-                content = f.read()
+                header, line = self._read_header(f)
+                for line in chain((line,), f):
+                    line = line.strip()
+                    if line.startswith('start.time') or line.startswith('#') or not line:
+                        continue
+
+                    match = self.CONSUMER_PATTERN.search(line)
+                    if match:
+                        metrics = {
+                            'start_time': match.group(1),
+                            'end_time': match.group(2),
+                            'data_consumed_mb': float(match.group(3)),
+                            'throughput_mb_sec': float(match.group(4)),
+                            'num_messages': int(match.group(5)),
+                            'throughput_msg_sec': float(match.group(6)),
+                            'rebalance_time_ms': int(match.group(7)),
+                            'fetch_time_ms': int(match.group(8)),
+                            'fetch_mb_sec': float(match.group(9)),
+                            'fetch_msg_sec': float(match.group(10)),
+                        }
+                        break
         except Exception as e:
             print(f"[ERROR] Failed to read {filepath}: {e}")
             return None
 
         # Extract configuration from header comments
-        config = self._extract_config_from_content(content)
+        config = self._extract_config_from_content(header)
         config.update(self._extract_config_from_filename(filepath, 'consumer'))
 
-        # Find consumer metrics (skip CSV header line)
-        metrics = {}
-        for line in content.split('\n'):
-            line = line.strip()
-            if line.startswith('start.time') or line.startswith('#') or not line:
-                continue
-
-            match = self.CONSUMER_PATTERN.search(line)
-            if match:
-                metrics = {
-                    'start_time': match.group(1),
-                    'end_time': match.group(2),
-                    'data_consumed_mb': float(match.group(3)),
-                    'throughput_mb_sec': float(match.group(4)),
-                    'num_messages': int(match.group(5)),
-                    'throughput_msg_sec': float(match.group(6)),
-                    'rebalance_time_ms': int(match.group(7)),
-                    'fetch_time_ms': int(match.group(8)),
-                    'fetch_mb_sec': float(match.group(9)),
-                    'fetch_msg_sec': float(match.group(10)),
-                }
-                break
-
         if not metrics:
             print(f"[WARN] No consumer metrics found in {filepath.name}")
             return None
@@ -220,15 +251,78 @@ class KafkaPerformanceParser:
             'metrics': metrics,
             'filepath': str(filepath),
             'filename': filepath.name,
-            'parse_time': datetime.now().isoformat()
+            'parse_time': self._batch_parse_time or datetime.now().isoformat()
         }
 
+    def _read_header(self, f) -> Tuple[str, str]:
+        """
+        Read the comment block at the top of a log file.
+
+        Args:
+            f: Log file opened for reading at its start
+
+        Returns:
+            Tuple of (header text, first line after the header or '' at end of file)
+        """
+        lines = []
+        for line in f:
+            if line.strip() and not line.lstrip().startswith('#'):
+                return ''.join(lines), line
+            lines.append(line)
+        return ''.join(lines), ''
+
+    @staticmethod
+    def _read_last_line_with(filepath: Path, marker: bytes) -> Optional[str]:
+        """
+        Find the last line of a file containing a marker, searching from the end.
+
+        The file is memory-mapped, so only the pages near the match are read
+        no matter how much output precedes it.
+
+        Args:
+            filepath: Path to the file
+            marker: Byte string to look for
+
+        Returns:
+            The decoded line without its line ending, or None if the marker is absent
+        """
+        with open(filepath, 'rb') as f:
+            if os.fstat(f.fileno()).st_size == 0:
+                return None
+            with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+                index = mm.rfind(marker)
+                if index < 0:
+                    return None
+                start = mm.rfind(b'\n', 0, index) + 1
+                end = mm.find(b'\n', index)
+                return mm[start:end if end >= 0 else len(mm)].decode('utf-8')
+
+    @classmethod
+    def _coerce_value(cls, value: str) -> Any:
+        """
+        Convert a configuration value to int or float when it is numeric.
+
+        Args:
+            value: Stripped value text
+
+        Returns:
+            int for digit strings, float for decimals, otherwise the text unchanged
+        """
+        try:
+            if value.isdigit():
+                return int(value)
+            if cls.DECIMAL_VALUE_PATTERN.fullmatch(value):
+                return float(value)
+        except ValueError:
+            pass
+        return value
+
     def _extract_config_from_content(self, content: str) -> Dict[str, Any]:
         """
         Extract configuration from log file header comments.
 
         Args:
-            content: Full content of the log file
+            content: Header comment block of the log file
 
         Returns:
             Dictionary of configuration values
@@ -275,16 +369,7 @@ class KafkaPerformanceParser:
                 if '=' in item:
                     key, value = item.split('=', 1)
                     key = key.strip().replace('.', '_')  # Normalize key names
-                    value = value.strip()
-                    # Try to convert to appropriate type
-                    try:
-                        if value.isdigit():
-                            value = int(value)
-                        elif value.replace('.', '').isdigit():
-                            value = float(value)
-                    except (ValueError, AttributeError):
-                        pass
-                    config[key] = value
+                    config[key] = self._coerce_value(value.strip())
 
         return config
 
@@ -308,18 +393,8 @@ class KafkaPerformanceParser:
         parts = filename.split('_')
 
         # Try to extract known configuration patterns
-        patterns = {
-            'acks': r'acks[_-]?(\w+)',
-            'batch': r'batch[_-]?(\d+)',
-            'linger': r'linger[_-]?(\d+)',
-            'size': r'size[_-]?(\d+)',
-            'compression': r'(none|snappy|lz4|zstd|gzip)',
-            'fetch': r'fetch[_-]?(\d+)',
-            'poll': r'poll[_-]?(\d+)',
-        }
-
-        for key, pattern in patterns.items():
-            match = re.search(pattern, filename, re.IGNORECASE)
+        for key, pattern in self.FILENAME_PATTERNS.items():
+            match = pattern.search(filename)
             if match:
                 value = match.group(1)
                 try:
@@ -335,6 +410,45 @@ class KafkaPerformanceParser:
 
         return config
 
+    def _parse_log_file(self, log_file: Path) -> Optional[Dict[str, Any]]:
+        """
+        Parse one log file, detecting its type from the filename or content.
+
+        Args:
+            log_file: Path to the log file
+
+        Returns:
+            Parsed result dictionary, or None if skipped or parsing fails
+        """
+        try:
+            filename_lower = log_file.name.lower()
+
+            if 'producer' in filename_lower:
+                result = self.parse_producer_log(log_file)
+            elif 'consumer' in filename_lower:
+                result = self.parse_consumer_log(log_file)
+            else:
+                # Try to detect from content; the markers are ASCII, so the
+                # raw bytes are searched without decoding them
+                with open(log_file, 'rb') as f:
+                    head = f.read(1000)  # Read first 1000 bytes
+
+                if b'Producer' in head or b'records sent' in head:
+                    result = self.parse_producer_log(log_file)
+                elif b'Consumer' in head or b'start.time' in head:
+                    result = self.parse_consumer_log(log_file)
+                else:
+                    self.log(f"Skipping unknown log type: {log_file.name}")
+                    return None
+
+            if result:
+                self.log(f"Successfully parsed: {log_file.name}")
+            return result
+
+        except Exception as e:
+            print(f"[ERROR] Failed to parse {log_file.name}: {e}")
+            return None
+
     def parse_all_logs(self) -> List[Dict[str, Any]]:
         """
         Parse all log files in the log directory.
@@ -344,8 +458,13 @@ class KafkaPerformanceParser:
         """
         all_results = []
 
-        # Find all .log files
-        log_files = list(self.log_dir.glob('*.log'))
+        # Find all .log files, in name order so results and the cache are
+        # written in a stable order
+        with os.scandir(self.log_dir) as entries:
+            log_files = [Path(path) for path in sorted(
+                entry.path for entry in entries
+                if entry.name.endswith('.log') and entry.is_file()
+            )]
 
         if not log_files:
             print(f"[WARN] No log files found in {self.log_dir}")
@@ -353,35 +472,128 @@ class KafkaPerformanceParser:
 
         self.log(f"Found {len(log_files)} log files to parse")
 
-        for log_file in sorted(log_files):
-            try:
-                filename_lower = log_file.name.lower()
+        # Logs whose modification time and size match the cache entry from a
+        # previous run keep their earlier result instead of being re-parsed.
+        # Keys use the resolved directory so relative and absolute log paths
+        # share entries; reused results report the path given for this run
+        cache = self._load_cache() if self.use_cache else {}
+        log_dir = self.log_dir.resolve()
+        keys = [str(log_dir / log_file.name) for log_file in log_files]
+        stats = {}
+        results_by_file = {}
+        for log_file, key in zip(log_files, keys):
+            st = log_file.stat()
+            stats[key] = (st.st_mtime_ns, st.st_size)
+            entry = cache.get(key)
+            if entry and (entry.get('mtime_ns'), entry.get('size')) == stats[key]:
+                result = entry.get('result')
+                if result:
+                    result['filepath'] = str(log_file)
+                results_by_file[key] = result
+
+        to_parse = [log_file for log_file, key in zip(log_files, keys) if key not in results_by_file]
+        if results_by_file:
+            self.log(f"Reusing cached results for {len(results_by_file)} unchanged log files")
+
+        # Files are independent, so large directories are split across worker
+        # processes; results keep the sorted file order either way. Workers
+        # get a copy of the parser, batch timestamp included.
+        parsed = None
+        workers = min(os.cpu_count() or 1, len(to_parse) // self.PARALLEL_MIN_FILES)
+        self._batch_parse_time = datetime.now().isoformat()
+        try:
+            if workers > 1:
+                try:
+                    with ProcessPoolExecutor(max_workers=workers) as executor:
+                        parsed = list(executor.map(self._parse_log_file, to_parse,
+                                                   chunksize=self.PARALLEL_MIN_FILES // 4))
+                except (OSError, NotImplementedError, BrokenProcessPool):
+                    # No usable worker processes (e.g. a sandbox without fork/spawn)
+                    parsed = None
+            if parsed is None:
+                parsed = [self._parse_log_file(log_file) for log_file in to_parse]
+        finally:
+            self._batch_parse_time = None
+
+        results_by_file.update(zip([key for key in keys if key not in results_by_file], parsed))
+        all_results.extend(result for result in map(results_by_file.get, keys) if result)
+
+        if self.use_cache:
+            # Only successful parses are kept so files that failed are retried
+            # (and reported) on the next run; deleted logs drop out
+            self._save_cache({
+                key: {'mtime_ns': mtime_ns, 'size': size, 'result': results_by_file[key]}
+                for key, (mtime_ns, size) in stats.items()
+                if results_by_file[key]
+            })
 
-                if 'producer' in filename_lower:
-                    result = self.parse_producer_log(log_file)
-                elif 'consumer' in filename_lower:
-                    result = self.parse_consumer_log(log_file)
-                else:
-                    # Try to detect from content
-                    with open(log_file, 'r', encoding='utf-8') as f:
-                        content = f.read(1000)  # Read first 1000 chars
-
-                    if 'Producer' in content or 'records sent' in content:
-                        result = self.parse_producer_log(log_file)
-                    elif 'Consumer' in content or 'start.time' in content:
-                        result = self.parse_consumer_log(log_file)
-                    else:
-                        self.log(f"Skipping unknown log type: {log_file.name}")
-                        continue
+        return all_results
 
-                if result:
-                    all_results.append(result)
-                    self.log(f"Successfully parsed: {log_file.name}")
+    def _load_cache(self) -> Dict[str, Any]:
+        """
+        Load results cached by a previous run.
+
+        Returns:
+            Dictionary of cache entries keyed by log file path, empty if the
+            cache is missing, unreadable or written by another parser version
+        """
+        cache_file = self.output_dir / self.CACHE_FILENAME
+        try:
+            payload = cache_file.read_bytes()
+        except FileNotFoundError:
+            return {}
+        except OSError as e:
+            print(f"[WARN] Could not read parse cache {cache_file}: {e}")
+            return {}
 
-            except Exception as e:
-                print(f"[ERROR] Failed to parse {log_file.name}: {e}")
+        try:
+            cache = orjson.loads(payload) if orjson else json.loads(payload)
+        except ValueError as e:
+            print(f"[WARN] Ignoring invalid parse cache {cache_file}: {e}")
+            return {}
+        if not isinstance(cache, dict) or cache.get('version') != self._cache_version():
+            self.log(f"Discarding parse cache {cache_file} from another parser version")
+            return {}
+        entries = cache.get('entries')
+        return entries if isinstance(entries, dict) else {}
+
+    def _cache_version(self) -> str:
+        """
+        Identify the cache layout and parser that produced cached results.
 
-        return all_results
+        Returns:
+            CACHE_VERSION combined with a digest of this script's source
+        """
+        source = Path(__file__).read_bytes()
+        return f"{self.CACHE_VERSION}:{hashlib.sha256(source).hexdigest()[:16]}"
+
+    def _save_cache(self, cache: Dict[str, Any]) -> None:
+        """
+        Write the parse cache for the next run.
+
+        Args:
+            cache: Dictionary of cache entries keyed by log file path
+        """
+        cache_file = self.output_dir / self.CACHE_FILENAME
+        try:
+            cache_file.write_bytes(self._dump_json({'version': self._cache_version(), 'entries': cache}))
+        except OSError as e:
+            print(f"[WARN] Could not write parse cache {cache_file}: {e}")
+
+    @staticmethod
+    def _dump_json(data: Any) -> bytes:
+        """
+        Serialize data as indented JSON, with orjson when it is installed.
+
+        Args:
+            data: JSON-serializable data; other values are written as strings
+
+        Returns:
+            UTF-8 encoded JSON document
+        """
+        if orjson:
+            return orjson.dumps(data, default=str, option=orjson.OPT_INDENT_2)
+        return json.dumps(data, indent=2, default=str).encode('utf-8')
 
     def save_results(self, results: List[Dict[str, Any]],
                      output_filename: Optional[str] = None) -> str:
@@ -401,8 +613,7 @@ class KafkaPerformanceParser:
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             output_file = self.output_dir / f"parsed_results_{timestamp}.json"
 
-        with open(output_file, 'w', encoding='utf-8') as f:
-            json.dump(results, f, indent=2, default=str)
+        output_file.write_bytes(self._dump_json(results))
 
         self.log(f"Results saved to: {output_file}")
         return str(output_file)
@@ -417,18 +628,20 @@ class KafkaPerformanceParser:
         Returns:
             List of paths to saved files
         """
-        saved_files = []
-
+        # Serialize here, then hand the small writes to threads so their
+        # open/write/close syscalls overlap
+        pending = []
         for result in results:
             # Create filename from original log filename
             original_name = Path(result.get('filename', 'unknown')).stem
             output_file = self.output_dir / f"{original_name}.json"
+            pending.append((output_file, self._dump_json(result)))
 
-            with open(output_file, 'w', encoding='utf-8') as f:
-                json.dump(result, f, indent=2, default=str)
-
-            saved_files.append(str(output_file))
+        if pending:
+            with ThreadPoolExecutor(max_workers=min(32, len(pending))) as executor:
+                list(executor.map(lambda item: item[0].write_bytes(item[1]), pending))
 
+        saved_files = [str(output_file) for output_file, _ in pending]
         return saved_files
 
 
@@ -488,6 +701,12 @@ Examples:
         help='Specific output filename (instead of auto-generated)'
     )
 
+    parser.add_argument(
+        '--no-cache',
+        action='store_true',
+        help='Re-parse every log instead of reusing results for unchanged files'
+    )
+
     args = parser.parse_args()
 
     # Handle alternative argument forms
@@ -500,7 +719,8 @@ Examples:
         sys.exit(1)
 
     # Create parser and run
-    perf_parser = KafkaPerformanceParser(log_dir, output_dir, verbose=args.verbose)
+    perf_parser = KafkaPerformanceParser(log_dir, output_dir, verbose=args.verbose,
+                                         use_cache=not args.no_cache)
     results = perf_parser.parse_all_logs()
 
     if not results: